@@ -2,6 +2,8 @@
 アラート検知モジュール
 変化点・異常を検出
 """
+import copy
+from array import array
 from typing import Dict, Any, List, Optional
 from config import ALERT_DAILY_CHANGE, ALERT_MA_WINDOW, ALERT_DOMESTIC_FOREIGN_GAP
 
@@ -11,10 +13,31 @@ class AlertDetector:
     
     def __init__(self):
         self.history: List[Dict[str, Any]] = []
+        
+        # 総合スコアのみを連続領域に保持（辞書を引かずに移動平均を計算）
+        self._totals = array("d")
+        
+        # 移動平均は追加時に1回だけ計算して保持
+        # ※ 累積和の差分更新は丸め誤差で符号判定（0付近）がぶれるため、
+        #   固定長ウィンドウを毎回そのまま合計する（O(ウィンドウ幅)）
+        self._window = ALERT_MA_WINDOW
+        self._ma: Optional[float] = None
+        self._prev_ma: Optional[float] = None
+        
+        # 前日比判定用（直近に追加した総合スコア）
+        self._last_total: Optional[float] = None
     
     def add_daily_score(self, aggregate_scores: Dict[str, Any]) -> None:
         """日次スコアを履歴に追加"""
         self.history.append(aggregate_scores)
+        
+        score = float(aggregate_scores.get("total_score", 0))
+        # 追加前の移動平均が「前回の移動平均」になる
+        self._prev_ma = self._ma
+        self._totals.append(score)
+        if len(self._totals) >= self._window:
+            self._ma = sum(self._totals[-self._window:]) / self._window
+        self._last_total = score
     
     def detect_alerts(self, current_scores: Dict[str, Any]) -> List[Dict[str, str]]:
         """
@@ -28,10 +51,9 @@ class AlertDetector:
         alerts = []
         
         # === 1. 前日比変化 ===
-        if len(self.history) >= 1:
-            prev_score = self.history[-1].get("total_score", 0)
+        if self._last_total is not None:
             curr_score = current_scores.get("total_score", 0)
-            daily_change = curr_score - prev_score
+            daily_change = curr_score - self._last_total
             
             if abs(daily_change) >= ALERT_DAILY_CHANGE:
                 direction = "上昇" if daily_change > 0 else "下落"
@@ -42,10 +64,9 @@ class AlertDetector:
                 })
         
         # === 2. 移動平均の符号反転 ===
-        if len(self.history) >= ALERT_MA_WINDOW:
-            recent_scores = [h.get("total_score", 0) for h in self.history[-ALERT_MA_WINDOW:]]
-            ma = sum(recent_scores) / len(recent_scores)
-            prev_ma = sum([h.get("total_score", 0) for h in self.history[-(ALERT_MA_WINDOW+1):-1]]) / ALERT_MA_WINDOW if len(self.history) > ALERT_MA_WINDOW else None
+        if self._ma is not None:
+            ma = self._ma
+            prev_ma = self._prev_ma
             
             if prev_ma is not None:
                 if ma >= 0 and prev_ma < 0:
@@ -79,9 +100,34 @@ class AlertDetector:
         
         return alerts
     
+    def detect_alerts_batch(self, scores_list: List[Dict[str, Any]]) -> List[List[Dict[str, str]]]:
+        """
+        複数日分のスコアを古い順に評価（履歴の再生・検証用）
+        
+        現在の履歴の複製に対して、各日について detect_alerts を実行した後に追加する。
+        この検知器自身の履歴・移動平均は変更しない。
+        移動平均は追加時に計算済みのため、全体で O(日数) で処理できる。
+        
+        Args:
+            scores_list: 日次スコアのリスト（古い順）
+        
+        Returns:
+            日ごとのアラートリスト
+        """
+        replay = copy.copy(self)
+        replay.history = self.history.copy()
+        replay._totals = self._totals[:]
+        
+        results = []
+        for scores in scores_list:
+            results.append(replay.detect_alerts(scores))
+            replay.add_daily_score(scores)
+        return results
+    
     def get_moving_average(self, window: int = 3) -> Optional[float]:
         """移動平均を取得"""
-        if len(self.history) < window:
+        if len(self._totals) < window:
             return None
-        recent = [h.get("total_score", 0) for h in self.history[-window:]]
-        return sum(recent) / len(recent)
+        if window == self._window:
+            return self._ma
+        return sum(self._totals[-window:]) / window
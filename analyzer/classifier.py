@@ -4,6 +4,43 @@
 """
 from typing import Dict, Any, List
 from config import CATEGORIES
+from utils.keyword_matcher import KeywordMatcher
+
+
+# 市場全体キーワード
+MARKET_KEYWORDS = (
+    "日経平均", "TOPIX", "ダウ", "S&P", "ナスダック", "NASDAQ",
+    "FRB", "日銀", "金融政策", "金利", "円安", "円高",
+    "GDP", "インフレ", "CPI", "雇用統計", "景気",
+    "利上げ", "利下げ", "量的緩和", "QE",
+)
+
+# セクターキーワード
+SECTOR_KEYWORDS = {
+    "テクノロジー": ("AI", "半導体", "クラウド", "ソフトウェア", "IT", "エヌビディア", "NVIDIA"),
+    "金融": ("銀行", "証券", "保険", "メガバンク", "金融機関"),
+    "自動車": ("自動車", "EV", "電気自動車", "トヨタ", "ホンダ"),
+    "不動産": ("不動産", "REIT", "住宅"),
+    "エネルギー": ("原油", "石油", "ガス", "電力", "再エネ"),
+    "ヘルスケア": ("製薬", "医療", "バイオ", "ヘルスケア"),
+    "消費": ("小売", "消費", "EC", "通販"),
+}
+
+# テーマキーワード
+THEME_KEYWORDS = {
+    "地政学リスク": ("戦争", "紛争", "制裁", "地政学", "ウクライナ", "中東", "台湾"),
+    "規制・政策": ("規制", "法案", "法律", "独禁法", "規制緩和"),
+    "決算・業績": ("決算", "業績", "売上", "利益", "増収", "減益"),
+    "M&A": ("買収", "合併", "M&A", "TOB", "統合"),
+}
+
+# 全キーワードを (category, sub_category) 付きで1つのマッチャーに登録
+# ※ 登録順 = 判定順（セクター・テーマは辞書順で最初に一致したものを採用）
+_MATCHER = KeywordMatcher(
+    [(kw, ("market", None)) for kw in MARKET_KEYWORDS]
+    + [(kw, ("sector", sector)) for sector, kws in SECTOR_KEYWORDS.items() for kw in kws]
+    + [(kw, ("theme", theme)) for theme, kws in THEME_KEYWORDS.items() for kw in kws]
+)
 
 
 def classify_news(news_text: str, source: str = "domestic") -> Dict[str, Any]:
@@ -17,58 +54,21 @@ def classify_news(news_text: str, source: str = "domestic") -> Dict[str, Any]:
     Returns:
         分類結果辞書
     """
-    # キーワードベースの簡易分類
-    text_lower = news_text.lower()
-    
-    # 市場全体キーワード
-    market_keywords = [
-        "日経平均", "TOPIX", "ダウ", "S&P", "ナスダック", "NASDAQ",
-        "FRB", "日銀", "金融政策", "金利", "円安", "円高",
-        "GDP", "インフレ", "CPI", "雇用統計", "景気",
-        "利上げ", "利下げ", "量的緩和", "QE",
-    ]
-    
-    # セクターキーワード
-    sector_keywords = {
-        "テクノロジー": ["AI", "半導体", "クラウド", "ソフトウェア", "IT", "エヌビディア", "NVIDIA"],
-        "金融": ["銀行", "証券", "保険", "メガバンク", "金融機関"],
-        "自動車": ["自動車", "EV", "電気自動車", "トヨタ", "ホンダ"],
-        "不動産": ["不動産", "REIT", "住宅"],
-        "エネルギー": ["原油", "石油", "ガス", "電力", "再エネ"],
-        "ヘルスケア": ["製薬", "医療", "バイオ", "ヘルスケア"],
-        "消費": ["小売", "消費", "EC", "通販"],
-    }
-    
-    # テーマキーワード
-    theme_keywords = {
-        "地政学リスク": ["戦争", "紛争", "制裁", "地政学", "ウクライナ", "中東", "台湾"],
-        "規制・政策": ["規制", "法案", "法律", "独禁法", "規制緩和"],
-        "決算・業績": ["決算", "業績", "売上", "利益", "増収", "減益"],
-        "M&A": ["買収", "合併", "M&A", "TOB", "統合"],
-    }
-    
-    # 分類判定
-    category = "market"  # デフォルト
-    sub_category = None
-    
-    # セクター判定
-    for sector, keywords in sector_keywords.items():
-        if any(kw in news_text for kw in keywords):
-            category = "sector"
-            sub_category = sector
-            break
-    
-    # テーマ判定
-    for theme, keywords in theme_keywords.items():
-        if any(kw in news_text for kw in keywords):
-            category = "theme"
-            sub_category = theme
-            break
+    # キーワードベースの簡易分類（1回の走査で全カテゴリを判定）
+    first_hit = {}
+    for _, (category, sub_category) in _MATCHER.find(news_text):
+        first_hit.setdefault(category, sub_category)
     
-    # 市場全体判定（優先度高）
-    if any(kw in news_text for kw in market_keywords):
+    # 優先度: 市場全体 > テーマ > セクター
+    if "market" in first_hit:
         category = "market"
-        sub_category = None
+    elif "theme" in first_hit:
+        category = "theme"
+    elif "sector" in first_hit:
+        category = "sector"
+    else:
+        category = "market"  # デフォルト
+    sub_category = first_hit.get(category)
     
     return {
         "text": news_text,
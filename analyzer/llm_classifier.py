@@ -9,9 +9,15 @@ Gemini APIを使用して:
 import os
 import json
 import hashlib
-from typing import Dict, Any, List, Optional, Tuple
-from dataclasses import dataclass
+import heapq
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, FrozenSet, List, Optional, Set, Tuple
+from dataclasses import dataclass, replace
 from dotenv import load_dotenv
+from config import LLM_CACHE_FILE
 
 load_dotenv()
 
@@ -22,8 +28,29 @@ try:
 except ImportError:
     GEMINI_AVAILABLE = False
 
+# 類似記事検出の候補絞り込み（MinHash LSH、任意）
+try:
+    from datasketch import MinHash, MinHashLSH
+    DATASKETCH_AVAILABLE = True
+except ImportError:
+    DATASKETCH_AVAILABLE = False
+
+# 重複判定用ハッシュ（非暗号学的ハッシュで十分なため xxHash を優先、任意）
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+# MinHashの置換数（精度と速度のトレードオフ）
+MINHASH_NUM_PERM = 64
+
+# 類似検出で LSH の候補絞り込みを使い始めるキャッシュ件数
+# （短い見出しでは LSH が閾値付近の類似記事を取りこぼすため、件数が少ないうちは全件を厳密に比較）
+LSH_MIN_CACHED = 2000
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LLMClassificationResult:
     """LLM分類結果（詳細版）"""
     category: str  # market, sector, theme
@@ -130,7 +157,7 @@ JSON形式で回答:
   "keywords": ["重要キーワード1", "キーワード2"]
 }"""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, cache_path: Optional[Path] = LLM_CACHE_FILE):
         if not GEMINI_AVAILABLE:
             raise ImportError("google-generativeai がインストールされていません")
         
@@ -143,69 +170,160 @@ JSON形式で回答:
         
         # 類似記事検出用のキャッシュ
         self.seen_hashes: Dict[str, Dict[str, Any]] = {}
+        # キャッシュ済み記事の単語集合（比較のたびにsetを作り直さない）
+        self._word_sets: Dict[str, FrozenSet[str]] = {}
+        
+        # 類似候補のインデックス（datasketch未インストール時は全件走査）
+        self.lsh = MinHashLSH(threshold=0.6, num_perm=MINHASH_NUM_PERM) if DATASKETCH_AVAILABLE else None
+        
+        # 分類結果の永続キャッシュ（プロセス再起動後も同一記事はAPIを呼ばない）
+        self._cache = self._open_cache(cache_path) if cache_path else None
+        
+        # スレッド並列時のキャッシュ更新を保護
+        self._cache_lock = threading.Lock()
+    
+    def _open_cache(self, cache_path: Path) -> Optional[sqlite3.Connection]:
+        """永続キャッシュ（SQLite）を開く"""
+        try:
+            conn = sqlite3.connect(str(cache_path), check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            # キーは全単語集合のハッシュ（類似検出用の content_hash は衝突しうるため使わない）
+            conn.execute("CREATE TABLE IF NOT EXISTS cls_v2 (key TEXT PRIMARY KEY, json TEXT NOT NULL)")
+            return conn
+        except sqlite3.Error as e:
+            print(f"LLMキャッシュを開けません: {e}")
+            return None
+    
+    def _load_cached(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """永続キャッシュから分類結果を取得"""
+        if self._cache is None:
+            return None
+        try:
+            row = self._cache.execute("SELECT json FROM cls_v2 WHERE key = ?", (cache_key,)).fetchone()
+            return json.loads(row[0]) if row else None
+        except (sqlite3.Error, json.JSONDecodeError):
+            return None
     
-    def _compute_content_hash(self, text: str) -> str:
+    def _save_cached(self, cache_key: str, result: Dict[str, Any]) -> None:
+        """永続キャッシュに分類結果を保存"""
+        if self._cache is None:
+            return
+        try:
+            with self._cache_lock:
+                self._cache.execute(
+                    "INSERT OR REPLACE INTO cls_v2 (key, json) VALUES (?, ?)",
+                    (cache_key, json.dumps(result, ensure_ascii=False)),
+                )
+        except sqlite3.Error:
+            pass
+    
+    def _tokenize(self, text: str) -> Set[str]:
+        """小文字化した単語集合を取得（1記事につき1回だけ計算して使い回す）"""
+        return set(text.lower().split())
+    
+    def _compute_content_hash(self, words: Set[str]) -> str:
         """コンテンツのハッシュを計算（類似検出用）"""
-        # 小文字化して主要単語のみ抽出
-        words = sorted(set(text.lower().split()))[:20]
-        return hashlib.md5(" ".join(words).encode()).hexdigest()[:12]
+        # 主要単語のみ抽出（辞書順で先頭20語、全件ソートは不要）
+        key = " ".join(heapq.nsmallest(20, words)).encode()
+        if XXHASH_AVAILABLE:
+            return xxhash.xxh3_64_hexdigest(key)[:12]
+        return hashlib.md5(key).hexdigest()[:12]
+    
+    def _compute_cache_key(self, words: Set[str]) -> str:
+        """永続キャッシュのキーを計算（全単語を使い、別記事同士が衝突しないようにする）"""
+        key = " ".join(sorted(words)).encode()
+        if XXHASH_AVAILABLE:
+            return xxhash.xxh3_128_hexdigest(key)
+        return hashlib.md5(key).hexdigest()
+    
+    def _minhash(self, words) -> "MinHash":
+        """単語集合のMinHashを計算"""
+        m = MinHash(num_perm=MINHASH_NUM_PERM)
+        m.update_batch([w.encode("utf-8") for w in words])
+        return m
     
-    def _is_similar(self, text: str, threshold: float = 0.6) -> Optional[Dict[str, Any]]:
+    def _is_similar(self, new_words: Set[str], threshold: float = 0.6) -> Optional[Dict[str, Any]]:
         """類似記事があるかチェック"""
-        new_words = set(text.lower().split())
+        # キャッシュが大きい場合のみLSHで候補を絞り込み、候補のみ厳密なJaccard係数で確認
+        if self.lsh is not None and len(self.seen_hashes) >= LSH_MIN_CACHED:
+            candidates = self.lsh.query(self._minhash(new_words))
+        else:
+            candidates = self.seen_hashes.keys()
         
-        for hash_key, cached in self.seen_hashes.items():
-            cached_words = set(cached.get("words", []))
-            if not cached_words:
-                continue
-            
-            # Jaccard係数で類似度計算
-            intersection = len(new_words & cached_words)
-            union = len(new_words | cached_words)
-            
-            if union > 0 and intersection / union >= threshold:
-                return cached
+        for hash_key in candidates:
+            cached_words = self._word_sets.get(hash_key)
+            if cached_words and _is_jaccard_similar(new_words, cached_words, threshold):
+                return self.seen_hashes[hash_key]
         
         return None
     
-    def classify_single(self, news_text: str, source_name: str = "") -> LLMClassificationResult:
-        """単一ニュースを詳細分類"""
-        content_hash = self._compute_content_hash(news_text)
+    def _group_pending(self, pending: List[Tuple[int, str, Set[str], str]],
+                       threshold: float = 0.6) -> Tuple[List[Tuple[int, str, Set[str], str]],
+                                                        List[Tuple[int, str, int]]]:
+        """
+        未分類ニュースをバッチ内の類似記事ごとにまとめる
         
-        # 類似記事チェック
-        similar = self._is_similar(news_text)
-        if similar:
-            return LLMClassificationResult(
-                category=similar["category"],
-                sub_category=similar.get("sub_category"),
-                impact_score=similar["impact_score"],
-                market_impact=similar.get("market_impact", similar["impact_score"]),
-                time_horizon=similar.get("time_horizon", "medium"),
-                confidence=similar.get("confidence", 3),
-                reason=f"[類似記事] {similar['reason']}",
-                positive_factors=similar.get("positive_factors", []),
-                negative_factors=similar.get("negative_factors", []),
-                uncertainty_factors=similar.get("uncertainty_factors", []),
-                keywords=similar.get("keywords", []),
-                content_hash=content_hash,
-            )
+        Returns:
+            (representatives, duplicates)
+            representatives: APIへ送る代表記事（各グループの最初の1件）
+            duplicates: (index, content_hash, 代表記事の index) のリスト
+        """
+        representatives = []
+        duplicates = []
+        for item in pending:
+            i, _, words, content_hash = item
+            for rep_index, _, rep_words, _ in representatives:
+                if _is_jaccard_similar(words, rep_words, threshold):
+                    duplicates.append((i, content_hash, rep_index))
+                    break
+            else:
+                representatives.append(item)
+        return representatives, duplicates
+    
+    def _result_from_similar(self, similar: Dict[str, Any], content_hash: str) -> LLMClassificationResult:
+        """類似記事のキャッシュから分類結果を生成"""
+        return LLMClassificationResult(
+            category=similar["category"],
+            sub_category=similar.get("sub_category"),
+            impact_score=similar["impact_score"],
+            market_impact=similar.get("market_impact", similar["impact_score"]),
+            time_horizon=similar.get("time_horizon", "medium"),
+            confidence=similar.get("confidence", 3),
+            reason=f"[類似記事] {similar['reason']}",
+            positive_factors=similar.get("positive_factors", []),
+            negative_factors=similar.get("negative_factors", []),
+            uncertainty_factors=similar.get("uncertainty_factors", []),
+            keywords=similar.get("keywords", []),
+            content_hash=content_hash,
+        )
+    
+    def _build_prompt(self, news_text: str) -> str:
+        """Gemini APIへのプロンプトを生成"""
+        return f"{self.SYSTEM_PROMPT}\n\n【ニュース】\n{news_text[:1500]}"
+    
+    def _handle_response(self, words: Set[str], content_hash: str, response_text: str) -> LLMClassificationResult:
+        """Gemini APIの応答をパースし、キャッシュに保存して分類結果を生成"""
+        # JSONパース
+        response_text = response_text.strip()
+        # ```json ... ``` を除去
+        if response_text.startswith("```"):
+            response_text = response_text.split("```")[1]
+            if response_text.startswith("json"):
+                response_text = response_text[4:]
         
-        # Gemini APIで分類
-        try:
-            prompt = f"{self.SYSTEM_PROMPT}\n\n【ニュース】\n{news_text[:1500]}"
-            response = self.model.generate_content(prompt)
-            
-            # JSONパース
-            response_text = response.text.strip()
-            # ```json ... ``` を除去
-            if response_text.startswith("```"):
-                response_text = response_text.split("```")[1]
-                if response_text.startswith("json"):
-                    response_text = response_text[4:]
-            
-            result = json.loads(response_text)
-            
-            # キャッシュに保存（詳細フィールド含む）
+        result = json.loads(response_text)
+        self._save_cached(self._compute_cache_key(words), result)
+        
+        return self._build_result(words, content_hash, result)
+    
+    def _build_result(self, words: Set[str], content_hash: str, result: Dict[str, Any]) -> LLMClassificationResult:
+        """パース済みの分類結果を類似検出キャッシュに登録し、分類結果を生成"""
+        # キャッシュに保存（詳細フィールド含む）
+        words = list(words)[:30]
+        with self._cache_lock:
+            if self.lsh is not None and content_hash not in self.seen_hashes:
+                self.lsh.insert(content_hash, self._minhash(words))
+            self._word_sets[content_hash] = frozenset(words)
             self.seen_hashes[content_hash] = {
                 "category": result.get("category", "market"),
                 "sub_category": result.get("sub_category"),
@@ -218,52 +336,124 @@ JSON形式で回答:
                 "negative_factors": result.get("negative_factors", []),
                 "uncertainty_factors": result.get("uncertainty_factors", []),
                 "keywords": result.get("keywords", []),
-                "words": list(set(news_text.lower().split()))[:30],
+                "words": words,
             }
-            
-            return LLMClassificationResult(
-                category=result.get("category", "market"),
-                sub_category=result.get("sub_category"),
-                impact_score=max(-10, min(10, result.get("impact_score", 0))),
-                market_impact=max(-10, min(10, result.get("market_impact", result.get("impact_score", 0)))),
-                time_horizon=result.get("time_horizon", "medium"),
-                confidence=max(1, min(5, result.get("confidence", 3))),
-                reason=result.get("reason", "LLM分類"),
-                positive_factors=result.get("positive_factors", []),
-                negative_factors=result.get("negative_factors", []),
-                uncertainty_factors=result.get("uncertainty_factors", []),
-                keywords=result.get("keywords", []),
-                content_hash=content_hash,
-            )
-            
+        
+        return LLMClassificationResult(
+            category=result.get("category", "market"),
+            sub_category=result.get("sub_category"),
+            impact_score=max(-10, min(10, result.get("impact_score", 0))),
+            market_impact=max(-10, min(10, result.get("market_impact", result.get("impact_score", 0)))),
+            time_horizon=result.get("time_horizon", "medium"),
+            confidence=max(1, min(5, result.get("confidence", 3))),
+            reason=result.get("reason", "LLM分類"),
+            positive_factors=result.get("positive_factors", []),
+            negative_factors=result.get("negative_factors", []),
+            uncertainty_factors=result.get("uncertainty_factors", []),
+            keywords=result.get("keywords", []),
+            content_hash=content_hash,
+        )
+    
+    def _error_result(self, error: Exception, content_hash: str) -> LLMClassificationResult:
+        """API呼び出し失敗時のフォールバック結果"""
+        return LLMClassificationResult(
+            category="market",
+            sub_category=None,
+            impact_score=0,
+            market_impact=0,
+            time_horizon="medium",
+            confidence=1,
+            reason=f"LLMエラー: {str(error)[:30]}",
+            positive_factors=[],
+            negative_factors=[],
+            uncertainty_factors=["API呼び出しに失敗"],
+            keywords=[],
+            content_hash=content_hash,
+        )
+    
+    def classify_single(self, news_text: str, source_name: str = "") -> LLMClassificationResult:
+        """単一ニュースを詳細分類"""
+        words = self._tokenize(news_text)
+        content_hash = self._compute_content_hash(words)
+        
+        # 永続キャッシュチェック
+        cached = self._load_cached(self._compute_cache_key(words))
+        if cached is not None:
+            return self._build_result(words, content_hash, cached)
+        
+        # 類似記事チェック
+        similar = self._is_similar(words)
+        if similar:
+            return self._result_from_similar(similar, content_hash)
+        
+        return self._classify_uncached(news_text, words, content_hash)
+    
+    def _classify_uncached(self, news_text: str, words: Set[str], content_hash: str) -> LLMClassificationResult:
+        """Gemini APIで分類（キャッシュ・類似記事チェック済みの前提）"""
+        try:
+            response = self.model.generate_content(self._build_prompt(news_text))
+            return self._handle_response(words, content_hash, response.text)
         except Exception as e:
-            # フォールバック
-            return LLMClassificationResult(
-                category="market",
-                sub_category=None,
-                impact_score=0,
-                market_impact=0,
-                time_horizon="medium",
-                confidence=1,
-                reason=f"LLMエラー: {str(e)[:30]}",
-                positive_factors=[],
-                negative_factors=[],
-                uncertainty_factors=["API呼び出しに失敗"],
-                keywords=[],
-                content_hash=content_hash,
-            )
+            return self._error_result(e, content_hash)
+    
+    def _classify_single(self, item: Tuple[int, str, Set[str], str]) -> LLMClassificationResult:
+        """スレッドプールのワーカー用: 1件を分類し、このインスタンスの類似検出キャッシュに登録"""
+        _, news_text, words, content_hash = item
+        return self._classify_uncached(news_text, words, content_hash)
+    
+    def _classify_pending(self, pending: List[Tuple[int, str, Set[str], str]],
+                          max_concurrent: int) -> List[LLMClassificationResult]:
+        """
+        未分類ニュースをスレッドプールで並行分類（入力順で返す）
+        
+        ※ generate_content_async は最初に実行したイベントループに非同期クライアントが
+          紐づくため、バッチごとに asyncio.run で新しいループを作ると2回目以降が失敗する。
+          常駐する webapp でも安全なよう、同期APIをスレッドで並列化する
+        """
+        with ThreadPoolExecutor(max_workers=max_concurrent) as executor:
+            return list(executor.map(self._classify_single, pending))
     
     def classify_batch(self, news_list: List[Dict[str, Any]], 
                        max_concurrent: int = 5) -> List[Dict[str, Any]]:
         """複数ニュースをバッチ分類（詳細評価付き）"""
-        results = []
+        classifications: List[Optional[LLMClassificationResult]] = [None] * len(news_list)
+        pending: List[Tuple[int, str, Set[str], str]] = []  # (index, text, words, content_hash)
         
-        for news in news_list:
+        # 永続キャッシュ・類似記事は先に同期的に解決し、キャッシュ外のものだけAPIへ送る
+        for i, news in enumerate(news_list):
             text = news.get("text", news.get("title", ""))
-            source = news.get("source_name", "")
+            words = self._tokenize(text)
+            content_hash = self._compute_content_hash(words)
             
-            classification = self.classify_single(text, source)
+            cached = self._load_cached(self._compute_cache_key(words))
+            if cached is not None:
+                classifications[i] = self._build_result(words, content_hash, cached)
+                continue
             
+            similar = self._is_similar(words)
+            if similar:
+                classifications[i] = self._result_from_similar(similar, content_hash)
+            else:
+                pending.append((i, text, words, content_hash))
+        
+        if pending:
+            # バッチ内の類似記事は代表の1件だけをAPIへ送り、結果を残りに適用する
+            representatives, duplicates = self._group_pending(pending)
+            classified = self._classify_pending(representatives, max_concurrent)
+            for (i, _, _, _), classification in zip(representatives, classified):
+                classifications[i] = classification
+            
+            for i, content_hash, rep_index in duplicates:
+                rep = classifications[rep_index]
+                similar = self.seen_hashes.get(rep.content_hash)
+                if similar:
+                    classifications[i] = self._result_from_similar(similar, content_hash)
+                else:
+                    # 代表記事の分類に失敗した場合は同じエラー結果を適用
+                    classifications[i] = replace(rep, content_hash=content_hash)
+        
+        results = []
+        for news, classification in zip(news_list, classifications):
             # 元のニュース情報とマージ（詳細フィールド含む）
             result = news.copy()
             result.update({
@@ -292,6 +482,17 @@ JSON形式で回答:
         }
 
 
+def _is_jaccard_similar(a: Set[str], b: Set[str], threshold: float) -> bool:
+    """2つの単語集合の Jaccard 係数が閾値以上か"""
+    # Jaccard係数の上限は min(a,b)/max(a,b)。閾値未満なら集合演算を省略
+    n_a, n_b = len(a), len(b)
+    if min(n_a, n_b) < threshold * max(n_a, n_b):
+        return False
+    
+    union = len(a | b)
+    return union > 0 and len(a & b) / union >= threshold
+
+
 def classify_with_llm(news_list: List[Dict[str, Any]], 
                       api_key: Optional[str] = None) -> List[Dict[str, Any]]:
     """LLMでニュースを分類（簡易関数）"""
@@ -8,6 +8,7 @@
 """
 from typing import Dict, Any, List
 from dataclasses import dataclass, field
+from utils.keyword_matcher import KeywordMatcher, lower_text
 
 
 @dataclass
@@ -47,62 +48,67 @@ class MacroObserver:
     """マクロ環境観測器"""
     
     # 為替関連キーワード
-    FX_KEYWORDS = [
+    FX_KEYWORDS = (
         "dollar", "yen", "usd/jpy", "exchange rate", "currency",
         "ドル", "円", "為替", "円安", "円高", "ドル高", "ドル安",
         "euro", "eur", "gbp", "pound",
-    ]
+    )
     
     # 金利・国債関連キーワード
-    RATES_KEYWORDS = [
+    RATES_KEYWORDS = (
         "treasury", "yield", "bond", "interest rate", "10-year",
         "国債", "金利", "利回り", "長期金利", "短期金利",
         "jgb", "bund", "gilt",
-    ]
+    )
     
     # 経済指標関連キーワード
-    DATA_KEYWORDS = [
+    DATA_KEYWORDS = (
         "cpi", "inflation", "jobs report", "employment", "gdp",
         "pce", "nonfarm payroll", "unemployment", "retail sales",
         "consumer price", "producer price", "pmi", "ism",
         "インフレ", "消費者物価", "雇用統計", "失業率",
-    ]
+    )
     
     def observe(self, news_list: List[Dict[str, Any]]) -> MacroObservation:
         """
         ニュースリストからマクロ環境を観測
         """
         result = MacroObservation()
+        news_by_bucket = {
+            "fx": result.fx_news,
+            "rates": result.rates_news,
+            "data": result.data_news,
+        }
+        keywords_by_bucket = {"fx": set(), "rates": set(), "data": set()}
         
         for news in news_list:
-            text = news.get("text", "").lower()
+            text = lower_text(news.get("text", ""))
             
-            # 為替チェック
-            matched_fx = [kw for kw in self.FX_KEYWORDS if kw.lower() in text]
-            if matched_fx:
-                result.fx_news.append(news)
-                result.fx_keywords.extend(matched_fx)
+            # 為替・金利・経済指標を1回の走査でチェック
+            matched_buckets = set()
+            for kw, bucket in _MATCHER.find(text):
+                keywords_by_bucket[bucket].add(kw)
+                matched_buckets.add(bucket)
             
-            # 金利チェック
-            matched_rates = [kw for kw in self.RATES_KEYWORDS if kw.lower() in text]
-            if matched_rates:
-                result.rates_news.append(news)
-                result.rates_keywords.extend(matched_rates)
-            
-            # 経済指標チェック
-            matched_data = [kw for kw in self.DATA_KEYWORDS if kw.lower() in text]
-            if matched_data:
-                result.data_news.append(news)
-                result.data_keywords.extend(matched_data)
+            for bucket in matched_buckets:
+                news_by_bucket[bucket].append(news)
         
-        # 重複削除
-        result.fx_keywords = list(set(result.fx_keywords))
-        result.rates_keywords = list(set(result.rates_keywords))
-        result.data_keywords = list(set(result.data_keywords))
+        result.fx_keywords = list(keywords_by_bucket["fx"])
+        result.rates_keywords = list(keywords_by_bucket["rates"])
+        result.data_keywords = list(keywords_by_bucket["data"])
         
         return result
 
 
+# 3分類のキーワードを1つのマッチャーにまとめる（小文字化はモジュール読み込み時に1回のみ）
+_MATCHER = KeywordMatcher(
+    [(kw, "fx") for kw in MacroObserver.FX_KEYWORDS]
+    + [(kw, "rates") for kw in MacroObserver.RATES_KEYWORDS]
+    + [(kw, "data") for kw in MacroObserver.DATA_KEYWORDS],
+    lower=True,
+)
+
+
 def observe_macro(news_list: List[Dict[str, Any]]) -> MacroObservation:
     """マクロ環境を観測（簡易関数）"""
     observer = MacroObserver()
@@ -3,9 +3,42 @@
 
 マーケットデータを人間が読みやすいテキストに変換
 """
+from bisect import bisect_right
 from typing import Dict, Any, List
 
 
+# ===== 方向・水準ラベルの早見表 =====
+# 符号 (-1/0/+1) + 1 をインデックスとして引く
+_FX_DIRECTION = ("円高", "横ばい", "円安")
+_FX_COMMENT = (
+    "→ 円高方向に振れる。リスクオフの動きか。",
+    "→ 小動きで方向感に欠ける展開。",
+    "→ 円安基調が継続。日米金利差拡大が背景か。",
+)
+_FX_TREND = ("円高", "小動き", "円安")
+_BOND_COMMENT = (
+    "→ 金利低下でリスク資産に追い風。",
+    None,
+    "→ 金利上昇でグロース株に逆風。",
+)
+
+# VIX水準（閾値以上で次の区分）
+_VIX_COMMENT_THRESHOLDS = (15, 20, 30)
+_VIX_COMMENT = (
+    "→ 15以下で非常に落ち着いた相場。楽観モード。",
+    "→ 20以下で市場は安定。リスクオン継続。",
+    "→ 20-30で警戒感高まる。ボラティリティ上昇。",
+    "→ 30超えで恐怖モード。リスク回避が加速。",
+)
+_RISK_TREND_THRESHOLDS = (20, 30)
+_RISK_TREND = ("リスクオン", "警戒モード", "リスクオフ")
+
+
+def _sign(value: float, band: float = 0) -> int:
+    """±band を超えた変化の符号（-1/0/+1）"""
+    return (value > band) - (value < -band)
+
+
 def generate_market_summary(market_data: Dict[str, Any]) -> Dict[str, Any]:
     """マーケット概況のテキスト要約を生成"""
     
@@ -14,14 +47,21 @@ def generate_market_summary(market_data: Dict[str, Any]) -> Dict[str, Any]:
         "one_liner": "",
     }
     
+    # カテゴリごとにシンボル→データの索引を1回だけ作成
+    fx_by = _index_by_symbol(market_data.get("fx", []))
+    bonds_by = _index_by_symbol(market_data.get("bonds", []))
+    risk_by = _index_by_symbol(market_data.get("risk", []))
+    commodity_by = _index_by_symbol(market_data.get("commodity", []))
+    index_by = _index_by_symbol(market_data.get("index", []))
+    
     # 【為替動向】
-    fx_section = _generate_fx_summary(market_data.get("fx", []))
+    fx_section = _generate_fx_summary(fx_by)
     if fx_section:
         summary["sections"].append(fx_section)
     
     # 【金利・債券】
     bond_section = _generate_bond_summary(
-        market_data.get("bonds", []),
+        bonds_by,
         market_data.get("interest_rate_diff"),
         market_data.get("yield_spread")
     )
@@ -29,37 +69,42 @@ def generate_market_summary(market_data: Dict[str, Any]) -> Dict[str, Any]:
         summary["sections"].append(bond_section)
     
     # 【リスク指標】
-    risk_section = _generate_risk_summary(market_data.get("risk", []))
+    risk_section = _generate_risk_summary(risk_by)
     if risk_section:
         summary["sections"].append(risk_section)
     
     # 【コモディティ】
-    commodity_section = _generate_commodity_summary(market_data.get("commodity", []))
+    commodity_section = _generate_commodity_summary(commodity_by)
     if commodity_section:
         summary["sections"].append(commodity_section)
     
     # 【株式市場】
-    index_section = _generate_index_summary(market_data.get("index", []))
+    index_section = _generate_index_summary(index_by)
     if index_section:
         summary["sections"].append(index_section)
     
     # 一言まとめ
-    summary["one_liner"] = _generate_one_liner(market_data)
+    summary["one_liner"] = _generate_one_liner(fx_by, risk_by)
     
     return summary
 
 
-def _generate_fx_summary(fx_data: List[Dict]) -> Dict[str, Any]:
+def _index_by_symbol(items: List[Dict]) -> Dict[str, Dict]:
+    """シンボルをキーにした索引を作成"""
+    return {item["symbol"]: item for item in items}
+
+
+def _generate_fx_summary(fx_by: Dict[str, Dict]) -> Dict[str, Any]:
     """為替セクションの要約を生成"""
-    if not fx_data:
+    if not fx_by:
         return None
     
     lines = []
-    usdjpy = next((f for f in fx_data if f["symbol"] == "USDJPY=X"), None)
-    eurjpy = next((f for f in fx_data if f["symbol"] == "EURJPY=X"), None)
+    usdjpy = fx_by.get("USDJPY=X")
+    eurjpy = fx_by.get("EURJPY=X")
     
     if usdjpy:
-        direction = "円安" if usdjpy["change"] > 0 else ("円高" if usdjpy["change"] < 0 else "横ばい")
+        direction = _FX_DIRECTION[_sign(usdjpy["change"]) + 1]
         lines.append(
             f"ドル円は{usdjpy['price']:.2f}円で取引中。"
             f"前日比{usdjpy['change']:+.2f}円（{usdjpy['change_percent']:+.2f}%）と{direction}方向。"
@@ -75,12 +120,7 @@ def _generate_fx_summary(fx_data: List[Dict]) -> Dict[str, Any]:
     
     # 解説
     if usdjpy:
-        if usdjpy["change"] > 0.3:
-            lines.append("→ 円安基調が継続。日米金利差拡大が背景か。")
-        elif usdjpy["change"] < -0.3:
-            lines.append("→ 円高方向に振れる。リスクオフの動きか。")
-        else:
-            lines.append("→ 小動きで方向感に欠ける展開。")
+        lines.append(_FX_COMMENT[_sign(usdjpy["change"], 0.3) + 1])
     
     return {
         "title": "為替動向",
@@ -89,14 +129,13 @@ def _generate_fx_summary(fx_data: List[Dict]) -> Dict[str, Any]:
     }
 
 
-def _generate_bond_summary(bonds: List[Dict], rate_diff: Dict, yield_spread: Dict) -> Dict[str, Any]:
+def _generate_bond_summary(bonds_by: Dict[str, Dict], rate_diff: Dict, yield_spread: Dict) -> Dict[str, Any]:
     """金利・債券セクションの要約を生成"""
-    if not bonds:
+    if not bonds_by:
         return None
     
     lines = []
-    us10y = next((b for b in bonds if b["symbol"] == "^TNX"), None)
-    us5y = next((b for b in bonds if b["symbol"] == "^FVX"), None)
+    us10y = bonds_by.get("^TNX")
     
     if us10y:
         lines.append(
@@ -124,10 +163,9 @@ def _generate_bond_summary(bonds: List[Dict], rate_diff: Dict, yield_spread: Dic
     
     # 解説
     if us10y:
-        if us10y["change"] > 0.03:
-            lines.append("→ 金利上昇でグロース株に逆風。")
-        elif us10y["change"] < -0.03:
-            lines.append("→ 金利低下でリスク資産に追い風。")
+        comment = _BOND_COMMENT[_sign(us10y["change"], 0.03) + 1]
+        if comment:
+            lines.append(comment)
     
     return {
         "title": "金利・債券",
@@ -136,26 +174,19 @@ def _generate_bond_summary(bonds: List[Dict], rate_diff: Dict, yield_spread: Dic
     }
 
 
-def _generate_risk_summary(risk_data: List[Dict]) -> Dict[str, Any]:
+def _generate_risk_summary(risk_by: Dict[str, Dict]) -> Dict[str, Any]:
     """リスク指標セクションの要約を生成"""
-    if not risk_data:
+    if not risk_by:
         return None
     
     lines = []
-    vix = next((r for r in risk_data if r["symbol"] == "^VIX"), None)
+    vix = risk_by.get("^VIX")
     
     if vix:
         lines.append(f"VIX指数: {vix['price']:.1f}（前日比{vix['change']:+.1f}）")
         
         # VIXレベルの解説
-        if vix['price'] < 15:
-            lines.append("→ 15以下で非常に落ち着いた相場。楽観モード。")
-        elif vix['price'] < 20:
-            lines.append("→ 20以下で市場は安定。リスクオン継続。")
-        elif vix['price'] < 30:
-            lines.append("→ 20-30で警戒感高まる。ボラティリティ上昇。")
-        else:
-            lines.append("→ 30超えで恐怖モード。リスク回避が加速。")
+        lines.append(_VIX_COMMENT[bisect_right(_VIX_COMMENT_THRESHOLDS, vix['price'])])
     
     return {
         "title": "リスク指標",
@@ -164,14 +195,14 @@ def _generate_risk_summary(risk_data: List[Dict]) -> Dict[str, Any]:
     }
 
 
-def _generate_commodity_summary(commodities: List[Dict]) -> Dict[str, Any]:
+def _generate_commodity_summary(commodity_by: Dict[str, Dict]) -> Dict[str, Any]:
     """コモディティセクションの要約を生成"""
-    if not commodities:
+    if not commodity_by:
         return None
     
     lines = []
-    gold = next((c for c in commodities if c["symbol"] == "GC=F"), None)
-    oil = next((c for c in commodities if c["symbol"] == "CL=F"), None)
+    gold = commodity_by.get("GC=F")
+    oil = commodity_by.get("CL=F")
     
     if gold:
         lines.append(f"ゴールド: ${gold['price']:.2f}（前日比${gold['change']:+.2f}）")
@@ -188,17 +219,16 @@ def _generate_commodity_summary(commodities: List[Dict]) -> Dict[str, Any]:
     }
 
 
-def _generate_index_summary(indices: List[Dict]) -> Dict[str, Any]:
+def _generate_index_summary(index_by: Dict[str, Dict]) -> Dict[str, Any]:
     """株式指数セクションの要約を生成"""
-    if not indices:
+    if not index_by:
         return None
     
     lines = []
-    sp500 = next((i for i in indices if i["symbol"] == "^GSPC"), None)
-    nikkei = next((i for i in indices if i["symbol"] == "^N225"), None)
+    sp500 = index_by.get("^GSPC")
+    nikkei = index_by.get("^N225")
     
     if sp500:
-        direction = "上昇" if sp500["change"] > 0 else ("下落" if sp500["change"] < 0 else "横ばい")
         lines.append(
             f"S&P500: {sp500['price']:,.2f}（{sp500['change']:+.2f}, {sp500['change_percent']:+.2f}%）"
         )
@@ -219,32 +249,14 @@ def _generate_index_summary(indices: List[Dict]) -> Dict[str, Any]:
     }
 
 
-def _generate_one_liner(market_data: Dict[str, Any]) -> str:
+def _generate_one_liner(fx_by: Dict[str, Dict], risk_by: Dict[str, Dict]) -> str:
     """一言まとめを生成"""
-    fx = market_data.get("fx", [])
-    risk = market_data.get("risk", [])
-    
-    usdjpy = next((f for f in fx if f["symbol"] == "USDJPY=X"), None)
-    vix = next((r for r in risk if r["symbol"] == "^VIX"), None)
+    usdjpy = fx_by.get("USDJPY=X")
+    vix = risk_by.get("^VIX")
     
     # トレンド判定
-    fx_trend = ""
-    if usdjpy:
-        if usdjpy["change"] > 0.2:
-            fx_trend = "円安"
-        elif usdjpy["change"] < -0.2:
-            fx_trend = "円高"
-        else:
-            fx_trend = "小動き"
-    
-    risk_trend = ""
-    if vix:
-        if vix["price"] < 20:
-            risk_trend = "リスクオン"
-        elif vix["price"] < 30:
-            risk_trend = "警戒モード"
-        else:
-            risk_trend = "リスクオフ"
+    fx_trend = _FX_TREND[_sign(usdjpy["change"], 0.2) + 1] if usdjpy else ""
+    risk_trend = _RISK_TREND[bisect_right(_RISK_TREND_THRESHOLDS, vix["price"])] if vix else ""
     
     # 組み合わせ
     if fx_trend and risk_trend:
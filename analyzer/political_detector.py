@@ -9,9 +9,10 @@
 from typing import Dict, Any, List
 from dataclasses import dataclass
 from datetime import datetime
+from utils.keyword_matcher import KeywordMatcher, lower_text
 
 
-@dataclass
+@dataclass(slots=True)
 class PoliticalEvent:
     """政治発言・市場感応イベント"""
     
@@ -105,6 +106,7 @@ class PoliticalEventDetector:
             "rate cut": "FRBに対する利下げ圧力を示唆",
             "rate hike": "金利上昇への言及",
             "fed": "中央銀行政策への言及",
+            "federal reserve": "中央銀行政策への言及",
             "default": "金融政策に関する発言",
         },
         "外交・安全保障": {
@@ -127,30 +129,24 @@ class PoliticalEventDetector:
         events = []
         
         for news in news_list:
-            text = news.get("text", "").lower()
+            text = lower_text(news.get("text", ""))
             source = news.get("source_name", "Unknown")
             
-            # 発言者の特定
+            # 発言者・市場感応キーワードを1回の走査で検出（登録順で返る）
             speaker = None
-            for keyword, name in self.SPEAKER_KEYWORDS.items():
-                if keyword in text:
-                    speaker = name
-                    break
-            
-            if not speaker:
-                continue
-            
-            # 市場感応キーワードと文脈の検出
             detected_keywords = []
             context = None
             
-            for kw, ctx in self.MARKET_SENSITIVE_KEYWORDS.items():
-                if kw.lower() in text:
+            for kw, (kind, value) in _MATCHER.find(text):
+                if kind == "speaker":
+                    if speaker is None:
+                        speaker = value
+                else:
                     detected_keywords.append(kw)
                     if context is None:
-                        context = ctx
+                        context = value
             
-            if not detected_keywords:
+            if not speaker or not detected_keywords:
                 continue
             
             # 要旨の生成（具体化）
@@ -183,14 +179,36 @@ class PoliticalEventDetector:
     
     def _generate_summary(self, context: str, keywords: List[str], text: str) -> str:
         """キーワードから具体的な要旨を生成"""
-        templates = self.SUMMARY_TEMPLATES.get(context, {})
-        
-        # 具体的なキーワードに基づいて要旨を選択
+        # 具体的なキーワードに基づいて要旨を選択（検出順で最初に該当したもの）
         for kw in keywords:
-            if kw in templates:
-                return templates[kw]
+            summary = _SUMMARY_BY_KEYWORD.get((context, kw))
+            if summary is not None:
+                return summary
         
-        return templates.get("default", "市場感応度の高い発言")
+        return _DEFAULT_SUMMARY.get(context, "市場感応度の高い発言")
+
+
+# 発言者 → 市場感応キーワードの順に登録（検出結果もこの順で返る）
+# 英字キーワードは単語単位で照合（"trade" が "trademark"、"nato" が "senator" に一致しないように）
+_MATCHER = KeywordMatcher(
+    [(kw, ("speaker", name)) for kw, name in PoliticalEventDetector.SPEAKER_KEYWORDS.items()]
+    + [(kw, ("market", ctx)) for kw, ctx in PoliticalEventDetector.MARKET_SENSITIVE_KEYWORDS.items()],
+    lower=True,
+    word_boundary=True,
+)
+
+# 要旨テンプレートを (文脈, キーワード) → 要旨 に平坦化
+_SUMMARY_BY_KEYWORD = {
+    (context, kw): summary
+    for context, templates in PoliticalEventDetector.SUMMARY_TEMPLATES.items()
+    for kw, summary in templates.items()
+    if kw != "default"
+}
+_DEFAULT_SUMMARY = {
+    context: templates["default"]
+    for context, templates in PoliticalEventDetector.SUMMARY_TEMPLATES.items()
+    if "default" in templates
+}
 
 
 def detect_political_events(news_list: List[Dict[str, Any]]) -> List[PoliticalEvent]:
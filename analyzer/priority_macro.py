@@ -8,9 +8,10 @@
 """
 from typing import Dict, Any, List
 from dataclasses import dataclass, field
+from utils.keyword_matcher import KeywordMatcher, lower_text
 
 
-@dataclass
+@dataclass(slots=True)
 class PriorityMacro:
     """最優先マクロ情報"""
     
@@ -121,39 +122,55 @@ class PriorityMacroDetector:
         result = PriorityMacro()
         
         for news in news_list:
-            text = news.get("text", "").lower()
+            text = lower_text(news.get("text", ""))
             
-            # FRB
-            if any(kw.lower() in text for kw in self.FED_KEYWORDS):
-                result.fed_news.append(news)
+            # 全カテゴリのキーワードを1回の走査で検出し、カテゴリのビットマスクに集約
+            mask = 0
+            for _, bit in _MATCHER.find(text):
+                mask |= bit
             
-            # 米国債
-            if any(kw.lower() in text for kw in self.TREASURY_KEYWORDS):
-                result.treasury_news.append(news)
+            if not mask:
+                continue
             
-            # USD/JPY
-            if any(kw.lower() in text for kw in self.USDJPY_KEYWORDS):
+            if mask & _FED:
+                result.fed_news.append(news)
+            if mask & _TREASURY:
+                result.treasury_news.append(news)
+            if mask & _USDJPY:
                 result.usdjpy_news.append(news)
-            
-            # DXY
-            if any(kw.lower() in text for kw in self.DXY_KEYWORDS):
+            if mask & _DXY:
                 result.dxy_news.append(news)
-            
-            # 雇用
-            if any(kw.lower() in text for kw in self.EMPLOYMENT_KEYWORDS):
+            if mask & _EMPLOYMENT:
                 result.employment_news.append(news)
-            
-            # 物価
-            if any(kw.lower() in text for kw in self.INFLATION_KEYWORDS):
+            if mask & _INFLATION:
                 result.inflation_news.append(news)
-            
-            # ISM
-            if any(kw.lower() in text for kw in self.ISM_KEYWORDS):
+            if mask & _ISM:
                 result.ism_news.append(news)
         
         return result
 
 
+# カテゴリのビット
+_FED = 1 << 0
+_TREASURY = 1 << 1
+_USDJPY = 1 << 2
+_DXY = 1 << 3
+_EMPLOYMENT = 1 << 4
+_INFLATION = 1 << 5
+_ISM = 1 << 6
+
+_MATCHER = KeywordMatcher(
+    [(kw, _FED) for kw in PriorityMacroDetector.FED_KEYWORDS]
+    + [(kw, _TREASURY) for kw in PriorityMacroDetector.TREASURY_KEYWORDS]
+    + [(kw, _USDJPY) for kw in PriorityMacroDetector.USDJPY_KEYWORDS]
+    + [(kw, _DXY) for kw in PriorityMacroDetector.DXY_KEYWORDS]
+    + [(kw, _EMPLOYMENT) for kw in PriorityMacroDetector.EMPLOYMENT_KEYWORDS]
+    + [(kw, _INFLATION) for kw in PriorityMacroDetector.INFLATION_KEYWORDS]
+    + [(kw, _ISM) for kw in PriorityMacroDetector.ISM_KEYWORDS],
+    lower=True,
+)
+
+
 def detect_priority_macro(news_list: List[Dict[str, Any]]) -> PriorityMacro:
     """最優先マクロを検知（簡易関数）"""
     detector = PriorityMacroDetector()
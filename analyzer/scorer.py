@@ -6,8 +6,75 @@
 - 判定理由は観測・状況整理のために付与
 - +0 = 失敗ではなく「方向性を断定できない」状態
 """
-from typing import Dict, Any, List, Tuple
+import random
+from functools import lru_cache
+from typing import Dict, Any, List, Sequence, Tuple
 from config import SCORE_MIN, SCORE_MAX
+from utils.keyword_matcher import KeywordMatcher, lower_text
+
+
+# ===== 方向性評価キーワード =====
+
+# ポジティブキーワード
+POSITIVE_KEYWORDS = {
+    # 強ポジティブ (+3)
+    "過去最高": 3, "急騰": 3, "大幅上昇": 3, "予想上回る": 3,
+    "beat expectations": 3, "record high": 3, "surge": 3,
+    "利下げ": 2, "金融緩和": 2, "景気回復": 2,
+    "rate cut": 2, "easing": 2, "recovery": 2,
+    # 中ポジティブ (+2)
+    "上昇": 2, "増益": 2, "好調": 2, "改善": 2, "成長": 2,
+    "買い越し": 2, "需要増": 2,
+    "rise": 2, "growth": 2, "gains": 2, "rally": 2,
+    # 弱ポジティブ (+1)
+    "堅調": 1, "安定": 1, "維持": 1, "底堅い": 1,
+    "stable": 1, "steady": 1,
+}
+
+# ネガティブキーワード
+NEGATIVE_KEYWORDS = {
+    # 強ネガティブ (-3)
+    "暴落": -3, "急落": -3, "危機": -3, "破綻": -3, "デフォルト": -3,
+    "crash": -3, "plunge": -3, "crisis": -3, "default": -3,
+    "利上げ": -2, "金融引き締め": -2, "リセッション": -2,
+    "rate hike": -2, "tightening": -2, "recession": -2,
+    # 中ネガティブ (-2)
+    "下落": -2, "減益": -2, "悪化": -2, "低下": -2, "減少": -2,
+    "売り越し": -2, "需要減": -2, "インフレ懸念": -2,
+    "decline": -2, "drop": -2, "fall": -2, "loss": -2, "tariff": -2,
+    # 弱ネガティブ (-1)
+    "軟調": -1, "弱含み": -1, "警戒": -1, "懸念": -1,
+    "uncertainty": -1, "concern": -1, "cautious": -1,
+}
+
+# 全キーワードを1つのマッチャーに登録（検出結果は登録順＝辞書順で返る）
+_MATCHER = KeywordMatcher(
+    list(POSITIVE_KEYWORDS.items()) + list(NEGATIVE_KEYWORDS.items()),
+    lower=True,
+)
+
+# ===== 補正係数 =====
+
+# 影響範囲による補正
+_CATEGORY_WEIGHTS = {
+    "market": 1.2,  # 市場全体は影響大
+    "sector": 1.0,  # セクターは中程度
+    "theme": 0.8,   # テーマは個別性が高い
+}
+
+# ソースによる補正（海外ニュースは先行指標として重視）
+_SOURCE_WEIGHTS = {
+    "foreign": 1.1,
+}
+
+# ±0 で評価材料がない場合のバリエーション
+_NEUTRAL_REASONS = (
+    "市場影響が限定的と判断",
+    "定性的情報に留まり、価格材料不足",
+    "市場全体への波及が不明確",
+    "個別・話題性中心で指数影響は限定的",
+    "事実報道で方向性を断定できず",
+)
 
 
 def calculate_impact_score(classified_news: Dict[str, Any]) -> Tuple[int, str]:
@@ -24,106 +91,65 @@ def calculate_impact_score(classified_news: Dict[str, Any]) -> Tuple[int, str]:
     """
     text = classified_news.get("text", "")
     category = classified_news.get("category", "market")
+    source = classified_news.get("source", "domestic")
+    
+    score, matched_positive, matched_negative = _score_text(text, category, source)
+    
+    # ===== 判定理由の生成 =====
+    # ※ ±0 の理由はランダムに選ぶため、キャッシュせず毎回生成する
+    reason = _generate_reason(score, matched_positive, matched_negative, category)
+    
+    return score, reason
+
+
+@lru_cache(maxsize=4096)
+def _score_text(text: str, category: str, source: str) -> Tuple[int, Tuple[str, ...], Tuple[str, ...]]:
+    """
+    本文・カテゴリ・ソースからスコアと一致キーワードを算出
+    
+    複数ソースで同じ記事が配信されることが多いため、結果をキャッシュする
     
+    Returns:
+        (score, matched_positive, matched_negative)
+    """
     score = 0
     matched_positive = []
     matched_negative = []
     
     # ===== 1. 方向性評価 =====
     
-    # ポジティブキーワード
-    positive_keywords = {
-        # 強ポジティブ (+3)
-        "過去最高": 3, "急騰": 3, "大幅上昇": 3, "予想上回る": 3,
-        "beat expectations": 3, "record high": 3, "surge": 3,
-        "利下げ": 2, "金融緩和": 2, "景気回復": 2,
-        "rate cut": 2, "easing": 2, "recovery": 2,
-        # 中ポジティブ (+2)
-        "上昇": 2, "増益": 2, "好調": 2, "改善": 2, "成長": 2,
-        "買い越し": 2, "需要増": 2,
-        "rise": 2, "growth": 2, "gains": 2, "rally": 2,
-        # 弱ポジティブ (+1)
-        "堅調": 1, "安定": 1, "維持": 1, "底堅い": 1,
-        "stable": 1, "steady": 1,
-    }
-    
-    # ネガティブキーワード
-    negative_keywords = {
-        # 強ネガティブ (-3)
-        "暴落": -3, "急落": -3, "危機": -3, "破綻": -3, "デフォルト": -3,
-        "crash": -3, "plunge": -3, "crisis": -3, "default": -3,
-        "利上げ": -2, "金融引き締め": -2, "リセッション": -2,
-        "rate hike": -2, "tightening": -2, "recession": -2,
-        # 中ネガティブ (-2)
-        "下落": -2, "減益": -2, "悪化": -2, "低下": -2, "減少": -2,
-        "売り越し": -2, "需要減": -2, "インフレ懸念": -2,
-        "decline": -2, "drop": -2, "fall": -2, "loss": -2, "tariff": -2,
-        # 弱ネガティブ (-1)
-        "軟調": -1, "弱含み": -1, "警戒": -1, "懸念": -1,
-        "uncertainty": -1, "concern": -1, "cautious": -1,
-    }
-    
-    # キーワードマッチング
-    text_lower = text.lower()
-    
-    for kw, val in positive_keywords.items():
-        if kw.lower() in text_lower:
-            score += val
+    # キーワードマッチング（ポジティブ・ネガティブを1回の走査でまとめて照合）
+    for kw, val in _MATCHER.find(lower_text(text)):
+        score += val
+        if val > 0:
             matched_positive.append(kw)
-    
-    for kw, val in negative_keywords.items():
-        if kw.lower() in text_lower:
-            score += val
+        else:
             matched_negative.append(kw)
     
     # ===== 2. 影響範囲による補正 =====
+    # ※ 補正ごとに int() で切り捨てる（従来のスコアと一致させるため）
     
-    # 市場全体は影響大
-    if category == "market":
-        score = int(score * 1.2)
-    # セクターは中程度
-    elif category == "sector":
-        score = int(score * 1.0)
-    # テーマは個別性が高い
-    elif category == "theme":
-        score = int(score * 0.8)
+    score = int(score * _CATEGORY_WEIGHTS.get(category, 1.0))
     
     # ===== 3. ソースによる補正 =====
     
-    source = classified_news.get("source", "domestic")
-    if source == "foreign":
-        # 海外ニュースは先行指標として重視
-        score = int(score * 1.1)
+    score = int(score * _SOURCE_WEIGHTS.get(source, 1.0))
     
     # ===== スコア範囲制限 =====
     score = max(SCORE_MIN, min(SCORE_MAX, score))
     
-    # ===== 判定理由の生成 =====
-    reason = _generate_reason(score, matched_positive, matched_negative, category)
-    
-    return score, reason
+    return score, tuple(matched_positive), tuple(matched_negative)
 
 
-def _generate_reason(score: int, positive: List[str], negative: List[str], category: str) -> str:
+def _generate_reason(score: int, positive: Sequence[str], negative: Sequence[str], category: str) -> str:
     """
     判定理由を生成
     
     観測・状況整理のための説明であり、投資助言ではない
     """
-    import random
-    
-    # ±0 で評価材料がない場合のバリエーション
-    neutral_reasons = [
-        "市場影響が限定的と判断",
-        "定性的情報に留まり、価格材料不足",
-        "市場全体への波及が不明確",
-        "個別・話題性中心で指数影響は限定的",
-        "事実報道で方向性を断定できず",
-    ]
-    
     if score == 0:
         if not positive and not negative:
-            return random.choice(neutral_reasons)
+            return random.choice(_NEUTRAL_REASONS)
         elif positive and negative:
             return f"好悪材料が混在（+: {', '.join(positive[:2])} / -: {', '.join(negative[:2])}）"
         else:
@@ -146,13 +172,21 @@ def _generate_reason(score: int, positive: List[str], negative: List[str], categ
             return f"弱い懸念材料の示唆（{', '.join(negative[:2])}）"
 
 
-def score_news_batch(classified_news_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def score_news_batch(
+    classified_news_list: List[Dict[str, Any]],
+    inplace: bool = False,
+) -> List[Dict[str, Any]]:
     """
     複数ニュースを一括スコアリング
+    
+    Args:
+        classified_news_list: 分類済みニュースリスト
+        inplace: True の場合、コピーせず元の辞書にスコアを書き込む
+                 （classify_news_batch の結果など、呼び出し元で再利用しない場合）
     """
     results = []
     for news in classified_news_list:
-        news_with_score = news.copy()
+        news_with_score = news if inplace else news.copy()
         score, reason = calculate_impact_score(news)
         news_with_score["impact_score"] = score
         news_with_score["score_reason"] = reason
@@ -172,18 +206,37 @@ def calculate_aggregate_scores(scored_news_list: List[Dict[str, Any]]) -> Dict[s
             "domestic_foreign_gap": 0,
             "news_count": 0,
             "zero_score_count": 0,
+            "plus2_count": 0,
+            "minus2_count": 0,
         }
     
-    domestic_scores = [n["impact_score"] for n in scored_news_list if n.get("source") == "domestic"]
-    foreign_scores = [n["impact_score"] for n in scored_news_list if n.get("source") == "foreign"]
-    
-    domestic_avg = sum(domestic_scores) / len(domestic_scores) if domestic_scores else 0
-    foreign_avg = sum(foreign_scores) / len(foreign_scores) if foreign_scores else 0
-    
-    all_scores = [n["impact_score"] for n in scored_news_list]
-    total_avg = sum(all_scores) / len(all_scores) if all_scores else 0
-    
-    zero_count = sum(1 for s in all_scores if s == 0)
+    # 1回の走査でソース別の合計・件数と ±0 / +2以上 / -2以下 の件数を集計
+    domestic_sum = domestic_count = 0
+    foreign_sum = foreign_count = 0
+    total_sum = 0
+    zero_count = plus2_count = minus2_count = 0
+    
+    for n in scored_news_list:
+        s = n["impact_score"]
+        total_sum += s
+        if s == 0:
+            zero_count += 1
+        elif s >= 2:
+            plus2_count += 1
+        elif s <= -2:
+            minus2_count += 1
+        
+        source = n.get("source")
+        if source == "domestic":
+            domestic_sum += s
+            domestic_count += 1
+        elif source == "foreign":
+            foreign_sum += s
+            foreign_count += 1
+    
+    domestic_avg = domestic_sum / domestic_count if domestic_count else 0
+    foreign_avg = foreign_sum / foreign_count if foreign_count else 0
+    total_avg = total_sum / len(scored_news_list)
     
     return {
         "total_score": round(total_avg, 1),
@@ -192,4 +245,6 @@ def calculate_aggregate_scores(scored_news_list: List[Dict[str, Any]]) -> Dict[s
         "domestic_foreign_gap": round(domestic_avg - foreign_avg, 1),
         "news_count": len(scored_news_list),
         "zero_score_count": zero_count,
+        "plus2_count": plus2_count,
+        "minus2_count": minus2_count,
     }
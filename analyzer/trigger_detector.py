@@ -10,7 +10,7 @@ from typing import Dict, Any, List
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class Trigger:
     """観測メモ"""
     id: str
@@ -43,47 +43,44 @@ class TriggerDetector:
         Returns:
             発火したトリガーのリスト
         """
+        # 発火したトリガーのみ生成する
         triggers = []
         
         # トリガーA: 材料出揃いの兆候
-        trigger_a = Trigger(
-            id="A",
-            name="材料出揃いの兆候",
-            message="市場が評価可能な材料に反応し始めている可能性があります。"
-        )
         if zero_ratio < 50 and (plus2_ratio > 30 or minus2_ratio > 30):
-            trigger_a.fired = True
-            triggers.append(trigger_a)
+            triggers.append(Trigger(
+                id="A",
+                name="材料出揃いの兆候",
+                message="市場が評価可能な材料に反応し始めている可能性があります。",
+                fired=True,
+            ))
         
         # トリガーB: ノイズ優勢状態
-        trigger_b = Trigger(
-            id="B",
-            name="ノイズ優勢状態",
-            message="判断材料として使いにくいニュースが多い状態が続いています。"
-        )
         if zero_ratio > 80 and consecutive_high_zero_days >= 2:
-            trigger_b.fired = True
-            triggers.append(trigger_b)
+            triggers.append(Trigger(
+                id="B",
+                name="ノイズ優勢状態",
+                message="判断材料として使いにくいニュースが多い状態が続いています。",
+                fired=True,
+            ))
         
         # トリガーC: 評価の偏り
-        trigger_c = Trigger(
-            id="C",
-            name="評価の偏り",
-            message="市場の受け止め方が一方向に偏っている可能性があります。"
-        )
         if plus2_ratio > 50 or minus2_ratio > 50:
-            trigger_c.fired = True
-            triggers.append(trigger_c)
+            triggers.append(Trigger(
+                id="C",
+                name="評価の偏り",
+                message="市場の受け止め方が一方向に偏っている可能性があります。",
+                fired=True,
+            ))
         
         # トリガーD: マクロ前提変化
-        trigger_d = Trigger(
-            id="D",
-            name="マクロ前提変化",
-            message="株価以外の前提条件（金利・為替など）への注目が高まっています。"
-        )
         if macro_ratio > 30:
-            trigger_d.fired = True
-            triggers.append(trigger_d)
+            triggers.append(Trigger(
+                id="D",
+                name="マクロ前提変化",
+                message="株価以外の前提条件（金利・為替など）への注目が高まっています。",
+                fired=True,
+            ))
         
         return triggers
 
@@ -20,6 +20,16 @@ LOG_DIR = DATA_DIR / "logs"
 # ログディレクトリ作成
 LOG_DIR.mkdir(parents=True, exist_ok=True)
 
+# LLM分類結果の永続キャッシュ
+LLM_CACHE_FILE = DATA_DIR / "llm_cache.db"
+
+# 外部API応答のファイルキャッシュ（秒）
+FETCH_CACHE_DIR = DATA_DIR / "cache"
+QUOTE_CACHE_TTL = 60             # 相場クォート
+HISTORY_OPEN_CACHE_TTL = 60      # 日足ヒストリカル（取引時間中。当日の足が更新されるためクォートと同程度）
+HISTORY_CACHE_TTL = 6 * 60 * 60  # 日足ヒストリカル（週末の休場中）
+NEWSAPI_CACHE_TTL = 5 * 60       # NewsAPI 応答
+
 # API設定
 NEWSAPI_KEY = os.getenv("NEWSAPI_KEY", "")
 
@@ -8,10 +8,13 @@
 """
 import json
 import os
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from config import LOG_DIR
+from utils.jsonio import json_dumps, json_loads
 
 
 class HistoryManager:
@@ -21,21 +24,109 @@ class HistoryManager:
     
     def __init__(self):
         self.history: List[Dict[str, Any]] = []
+        
+        # 日付 → 記録の索引と、日付の新しい順に並べた記録（_reindex で更新）
+        self._by_date: Dict[str, Dict[str, Any]] = {}
+        self._sorted_history: List[Dict[str, Any]] = []
+        
+        # buffered() 中は保存を遅延し、終了時に1回だけ書き込む
+        self._buffering = False
+        self._dirty = False
+        
+        # 読み込み/保存時点のファイル更新時刻（他プロセスによる更新の検知用）
+        self._mtime: Optional[int] = None
+        
+        # 共有インスタンスを複数スレッド（webapp のリクエスト）から更新するための保護
+        self._lock = threading.RLock()
+        
         self._load()
     
+    def _file_mtime(self) -> Optional[int]:
+        """履歴ファイルの更新時刻（ファイルがなければ None）"""
+        try:
+            return self.HISTORY_FILE.stat().st_mtime_ns
+        except OSError:
+            return None
+    
+    def is_stale(self) -> bool:
+        """読み込み後に履歴ファイルが外部で更新されたか"""
+        return self._file_mtime() != self._mtime
+    
     def _load(self) -> None:
         """履歴ファイルを読み込み"""
-        if self.HISTORY_FILE.exists():
+        with self._lock:
+            self._mtime = self._file_mtime()
+            if self.HISTORY_FILE.exists():
+                try:
+                    with open(self.HISTORY_FILE, "rb") as f:
+                        raw = f.read()
+                    self.history = json_loads(raw)
+                except (json.JSONDecodeError, IOError):
+                    self.history = []
+            self._reindex()
+    
+    def _reindex(self) -> None:
+        """日付の索引と並び順を作り直す"""
+        with self._lock:
+            self._by_date = {}
+            for record in self.history:
+                # 同日の記録が複数ある場合は先頭を更新対象とする
+                self._by_date.setdefault(record.get("date"), record)
+            self._sorted_history = sorted(self.history, key=lambda x: x.get("date", ""), reverse=True)
+    
+    @contextmanager
+    def buffered(self):
+        """
+        ブロック内の保存をまとめて1回にする
+        
+        例:
+            with manager.buffered():
+                manager.add_daily_record(...)
+                manager.add_daily_record(...)
+        """
+        # ブロック全体でロックを保持し、他スレッドの更新が保存から漏れないようにする
+        with self._lock:
+            if self._buffering:
+                # 入れ子の場合は外側でまとめて保存
+                yield self
+                return
+            
+            self._buffering = True
+            self._dirty = False
             try:
-                with open(self.HISTORY_FILE, "r", encoding="utf-8") as f:
-                    self.history = json.load(f)
-            except (json.JSONDecodeError, IOError):
-                self.history = []
+                yield self
+            finally:
+                self._buffering = False
+                if self._dirty:
+                    self._dirty = False
+                    self._save()
     
     def _save(self) -> None:
         """履歴ファイルを保存"""
-        with open(self.HISTORY_FILE, "w", encoding="utf-8") as f:
-            json.dump(self.history, f, ensure_ascii=False, indent=2)
+        with self._lock:
+            if self._buffering:
+                self._dirty = True
+                return
+            
+            # 1回の書き込みで済むよう、先に全体をエンコードしておく
+            payload = json_dumps(self.history, indent=True)
+            
+            # 一時ファイルに書き切ってから置き換える（書き込み途中の中断で履歴を壊さない）
+            # 一時ファイル名はプロセス・スレッドごとに分け、同時に保存しても衝突させない
+            tmp_path = self.HISTORY_FILE.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            try:
+                with open(tmp_path, "wb") as f:
+                    f.write(payload)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.HISTORY_FILE)
+            except OSError:
+                try:
+                    tmp_path.unlink()
+                except OSError:
+                    pass
+                raise
+            self._mtime = self._file_mtime()
     
     def add_daily_record(
         self,
@@ -47,11 +138,12 @@ class HistoryManager:
         macro_ratio: float = 0
     ) -> None:
         """日次記録を追加"""
-        today = datetime.now().strftime("%Y-%m-%d")
-        
-        # 同日の記録があれば更新
-        for record in self.history:
-            if record.get("date") == today:
+        with self._lock:
+            today = datetime.now().strftime("%Y-%m-%d")
+            
+            # 同日の記録があれば更新
+            record = self._by_date.get(today)
+            if record is not None:
                 record.update({
                     "total_score": total_score,
                     "zero_ratio": zero_ratio,
@@ -62,23 +154,24 @@ class HistoryManager:
                 })
                 self._save()
                 return
-        
-        # 新規追加
-        self.history.append({
-            "date": today,
-            "total_score": total_score,
-            "zero_ratio": zero_ratio,
-            "plus2_ratio": plus2_ratio,
-            "minus2_ratio": minus2_ratio,
-            "news_count": news_count,
-            "macro_ratio": macro_ratio,
-        })
-        
-        # 30日以上古いデータは削除
-        cutoff = (datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d")
-        self.history = [r for r in self.history if r.get("date", "") >= cutoff]
-        
-        self._save()
+            
+            # 新規追加
+            self.history.append({
+                "date": today,
+                "total_score": total_score,
+                "zero_ratio": zero_ratio,
+                "plus2_ratio": plus2_ratio,
+                "minus2_ratio": minus2_ratio,
+                "news_count": news_count,
+                "macro_ratio": macro_ratio,
+            })
+            
+            # 30日以上古いデータは削除
+            cutoff = (datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d")
+            self.history = [r for r in self.history if r.get("date", "") >= cutoff]
+            self._reindex()
+            
+            self._save()
     
     def get_last_n_days(self, n: int = 7) -> List[Dict[str, Any]]:
         """過去n日分のデータを取得"""
@@ -108,11 +201,19 @@ class HistoryManager:
                 "days_count": 0,
             }
         
-        # 平均値を計算
-        avg_total = sum(r.get("total_score", 0) for r in past_records) / len(past_records)
-        avg_zero = sum(r.get("zero_ratio", 0) for r in past_records) / len(past_records)
-        avg_plus2 = sum(r.get("plus2_ratio", 0) for r in past_records) / len(past_records)
-        avg_minus2 = sum(r.get("minus2_ratio", 0) for r in past_records) / len(past_records)
+        # 平均値を計算（1回の走査で4項目を合計）
+        sum_total = sum_zero = sum_plus2 = sum_minus2 = 0
+        for r in past_records:
+            sum_total += r.get("total_score", 0)
+            sum_zero += r.get("zero_ratio", 0)
+            sum_plus2 += r.get("plus2_ratio", 0)
+            sum_minus2 += r.get("minus2_ratio", 0)
+        
+        count = len(past_records)
+        avg_total = sum_total / count
+        avg_zero = sum_zero / count
+        avg_plus2 = sum_plus2 / count
+        avg_minus2 = sum_minus2 / count
         
         return {
             "has_history": True,
@@ -133,9 +234,7 @@ class HistoryManager:
         count = 0
         
         # 最新から遡って確認
-        sorted_history = sorted(self.history, key=lambda x: x.get("date", ""), reverse=True)
-        
-        for record in sorted_history:
+        for record in self._sorted_history:
             if record.get("date") == today:
                 continue  # 当日は除外
             if record.get("zero_ratio", 0) > 80:
@@ -146,6 +245,19 @@ class HistoryManager:
         return count
 
 
+_manager: Optional[HistoryManager] = None
+_manager_lock = threading.Lock()
+
+
 def get_history_manager() -> HistoryManager:
-    """履歴マネージャーを取得"""
-    return HistoryManager()
+    """
+    履歴マネージャーを取得
+    
+    プロセス内で1つのインスタンスを使い回し、履歴ファイルの読み込み・解析を省く
+    （ファイルが外部で更新されていれば読み込み直す）
+    """
+    global _manager
+    with _manager_lock:
+        if _manager is None or _manager.is_stale():
+            _manager = HistoryManager()
+        return _manager
@@ -0,0 +1,23 @@
+"""
+取得処理の共通モジュール
+
+HTTPセッションを各クライアントで1つ共有し、keep-alive 接続を呼び出し間で再利用する
+"""
+from typing import Optional
+
+import requests
+
+
+# 共通の User-Agent（既定の python-requests だと拒否するサイトがあるため）
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+
+_session: Optional[requests.Session] = None
+
+
+def get_session() -> requests.Session:
+    """共有セッションを取得（初回のみ生成）"""
+    global _session
+    if _session is None:
+        _session = requests.Session()
+        _session.headers.update({"User-Agent": USER_AGENT})
+    return _session
@@ -4,15 +4,28 @@
 重要な経済指標（雇用統計、CPI、ISM等）の
 予想値・結果・前回値を取得
 """
-import requests
 from bs4 import BeautifulSoup
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
-from dataclasses import dataclass
-import re
+from dataclasses import dataclass, field
 
+from utils.keyword_matcher import KeywordMatcher
+from .common import get_session
+from .ttl_cache import ttl_cache
 
-@dataclass
+# HTMLパーサー（lxml が利用可能なら C 実装のパーサーを使用）
+try:
+    import lxml
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+
+# 数値化の前に取り除く記号・単位（%, K, M, B, 桁区切り）
+_VALUE_STRIP_TABLE = str.maketrans("", "", "%KMB,")
+
+
+@dataclass(slots=True, frozen=True)
 class EconomicIndicator:
     """経済指標"""
     name: str
@@ -24,9 +37,15 @@ class EconomicIndicator:
     previous: Optional[str]
     impact: str  # high, medium, low
     
+    # サプライズ度（生成時に1回だけ計算）
+    _surprise: Optional[float] = field(init=False, repr=False, compare=False, default=None)
+    
+    def __post_init__(self):
+        object.__setattr__(self, "_surprise", self._calculate_surprise())
+    
     def to_dict(self) -> dict:
         # 数値比較でサプライズ判定
-        surprise = self._calculate_surprise()
+        surprise = self._surprise
         
         return {
             "name": self.name,
@@ -47,7 +66,7 @@ class EconomicIndicator:
             return None
         try:
             # %, K, M, B などを除去
-            cleaned = re.sub(r'[%KMB,]', '', val.strip())
+            cleaned = val.strip().translate(_VALUE_STRIP_TABLE)
             return float(cleaned)
         except:
             return None
@@ -97,9 +116,11 @@ class EconomicCalendarFetcher:
     ]
     
     def __init__(self):
-        self.headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-        }
+        # 接続を使い回すため、モジュール共通のセッションを使用（User-Agent 設定済み）
+        self.session = get_session()
+        
+        # 取得に失敗してモックデータを返したか（キャッシュ可否の判定用）
+        self.used_mock_data = False
     
     def fetch_from_investing(self) -> List[EconomicIndicator]:
         """Investing.comから経済指標を取得"""
@@ -107,12 +128,13 @@ class EconomicCalendarFetcher:
         # 代替としてモック/キャッシュデータを使用する場合あり
         try:
             url = "https://www.investing.com/economic-calendar/"
-            resp = requests.get(url, headers=self.headers, timeout=10)
+            resp = self.session.get(url, timeout=10)
             
             if resp.status_code != 200:
+                self.used_mock_data = True
                 return self._get_mock_data()
             
-            soup = BeautifulSoup(resp.text, "html.parser")
+            soup = BeautifulSoup(resp.text, HTML_PARSER)
             indicators = []
             
             # 経済カレンダーテーブルをパース
@@ -160,6 +182,7 @@ class EconomicCalendarFetcher:
             
         except Exception as e:
             print(f"[EconomicCalendar] Error: {e}")
+            self.used_mock_data = True
             return self._get_mock_data()
     
     def _get_mock_data(self) -> List[EconomicIndicator]:
@@ -269,22 +292,40 @@ class EconomicCalendarFetcher:
         all_indicators = self.fetch_from_investing()
         
         # 重要度が高い、または重要キーワードを含むものをフィルタ
+        # （最大10件に達した時点で打ち切り、残りは判定・辞書化しない）
         important = []
         for ind in all_indicators:
-            name_lower = ind.name.lower()
-            is_important = ind.impact == "high" or any(
-                kw in name_lower for kw in self.IMPORTANT_INDICATORS
-            )
-            if is_important:
+            if ind.impact == "high" or _IMPORTANT_MATCHER.contains(ind.name.lower()):
                 important.append(ind.to_dict())
+                if len(important) >= _MAX_IMPORTANT_INDICATORS:
+                    break
         
-        return important[:10]  # 最大10件
+        return important
+
+
+# 返す重要指標の最大件数
+_MAX_IMPORTANT_INDICATORS = 10
+
+# 重要指標キーワードを1回の走査で判定するマッチャー
+_IMPORTANT_MATCHER = KeywordMatcher(
+    [(kw, None) for kw in EconomicCalendarFetcher.IMPORTANT_INDICATORS],
+    lower=True,
+)
+
+
+# 指標の更新は高々1時間単位のため15分間は前回結果を返す
+# （モックデータへのフォールバック時はキャッシュせず、次回に再取得する）
+@ttl_cache(15 * 60, cache_if=lambda result: result[1])
+def _fetch_important_indicators() -> Tuple[List[Dict[str, Any]], bool]:
+    """重要指標と、実データを取得できたかを返す"""
+    fetcher = EconomicCalendarFetcher()
+    indicators = fetcher.get_important_indicators()
+    return indicators, not fetcher.used_mock_data
 
 
 def get_economic_indicators() -> List[Dict[str, Any]]:
     """経済指標取得（簡易関数）"""
-    fetcher = EconomicCalendarFetcher()
-    return fetcher.get_important_indicators()
+    return _fetch_important_indicators()[0]
 
 
 if __name__ == "__main__":
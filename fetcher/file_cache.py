@@ -0,0 +1,66 @@
+"""
+取得結果のファイルキャッシュモジュール
+
+プロセスをまたいで外部APIの応答を一定時間再利用する
+- main.py を1時間に何度も実行する場合でも、TTL内は通信せずに前回結果を返す
+- 値は JSON で保存するため、dict / list / 数値 / 文字列のみ扱える
+"""
+import hashlib
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from config import FETCH_CACHE_DIR
+from utils.jsonio import json_dumps, json_loads
+
+
+class FileCache:
+    """TTL付きのファイルキャッシュ（1キー = 1ファイル）"""
+
+    def __init__(self, namespace: str, cache_dir: Path = FETCH_CACHE_DIR):
+        self.directory = cache_dir / namespace
+
+    def _path(self, key: str) -> Path:
+        # シンボル（"^TNX", "USDJPY=X" 等）をそのままファイル名にしないようハッシュ化
+        digest = hashlib.md5(key.encode("utf-8")).hexdigest()
+        return self.directory / f"{digest}.json"
+
+    def get(self, key: str, ttl: float) -> Optional[Any]:
+        """ttl 秒以内に保存された値を取得（なければ None）"""
+        try:
+            with open(self._path(key), "rb") as f:
+                raw = f.read()
+            entry = json_loads(raw)
+        except (OSError, ValueError):
+            return None
+
+        # 破損・形式違いのファイルはキャッシュなしとして扱う
+        if not isinstance(entry, dict):
+            return None
+        if time.time() - entry.get("ts", 0) >= ttl:
+            return None
+        return entry.get("data")
+
+    def set(self, key: str, data: Any) -> None:
+        """値を保存（保存できなくても取得処理は続行）"""
+        path = self._path(key)
+        entry = {"ts": time.time(), "data": data}
+        try:
+            payload = json_dumps(entry)
+        except TypeError:
+            return
+
+        # 一時ファイルに書き切ってから置き換える（並列取得時の読みかけ・書きかけを防ぐ）
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except OSError:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
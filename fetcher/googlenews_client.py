@@ -3,13 +3,32 @@ Google News RSS フェッチャー
 
 NewsAPIを補完するため、Google NewsのRSSフィードからニュースを取得
 """
+import threading
 import requests
 import xml.etree.ElementTree as ET
-from datetime import datetime
-from typing import List, Optional
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from io import BytesIO
+from typing import Dict, List, Optional, Tuple
 from urllib.parse import quote
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from models.news_dto import NewsDTO, NewsFetchResult
+from utils.keyword_matcher import KeywordMatcher
+from .common import get_session
+from .ttl_cache import ttl_cache
+
+# lxml が利用可能なら item 単位のストリーミング解析を使用
+try:
+    from lxml import etree as lxml_etree
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+
+# URL → (ETag, Last-Modified, 前回の取得結果)
+# クライアントは呼び出しごとに生成されるため、モジュール単位で保持する
+_RSS_CACHE: Dict[str, Tuple[Optional[str], Optional[str], NewsFetchResult]] = {}
+_RSS_CACHE_LOCK = threading.Lock()
 
 
 class GoogleNewsClient:
@@ -41,10 +60,8 @@ class GoogleNewsClient:
     ]
     
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-        })
+        # 接続を使い回すため、モジュール共通のセッションを使用
+        self.session = get_session()
     
     def fetch_top_stories(self, topic: str = "BUSINESS") -> NewsFetchResult:
         """
@@ -81,60 +98,49 @@ class GoogleNewsClient:
     def _fetch_rss(self, url: str, source_name: str) -> NewsFetchResult:
         """RSSフィードをパース"""
         try:
-            response = self.session.get(url, timeout=8)
+            # 前回取得分があれば条件付きGET（未更新なら 304 で本文なし）
+            with _RSS_CACHE_LOCK:
+                cached = _RSS_CACHE.get(url)
+            
+            headers = {}
+            if cached:
+                etag, last_modified, _ = cached
+                if etag:
+                    headers["If-None-Match"] = etag
+                if last_modified:
+                    headers["If-Modified-Since"] = last_modified
+            
+            response = self.session.get(url, timeout=8, headers=headers)
+            if response.status_code == 304 and cached:
+                return cached[2]
             response.raise_for_status()
             
-            root = ET.fromstring(response.content)
-            channel = root.find("channel")
+            if LXML_AVAILABLE:
+                news_list = self._parse_items_streaming(response.content)
+            else:
+                news_list = self._parse_items(response.content)
             
-            if channel is None:
+            if news_list is None:
                 return NewsFetchResult(
                     success=False,
                     error_message="Invalid RSS feed",
                     source_api=source_name,
                 )
             
-            news_list = []
-            for item in channel.findall("item"):
-                try:
-                    title = item.find("title")
-                    link = item.find("link")
-                    pub_date = item.find("pubDate")
-                    source = item.find("source")
-                    description = item.find("description")
-                    
-                    # 日時パース
-                    published_at = datetime.now()
-                    if pub_date is not None and pub_date.text:
-                        try:
-                            published_at = datetime.strptime(
-                                pub_date.text, 
-                                "%a, %d %b %Y %H:%M:%S %Z"
-                            )
-                        except ValueError:
-                            pass
-                    
-                    dto = NewsDTO(
-                        title=title.text if title is not None else "",
-                        description=description.text if description is not None else "",
-                        source_name=source.text if source is not None else "Google News",
-                        published_at=published_at,
-                        region="foreign",
-                        url=link.text if link is not None else None,
-                    )
-                    
-                    if dto.title.strip():
-                        news_list.append(dto)
-                        
-                except Exception:
-                    continue
-            
-            return NewsFetchResult(
+            result = NewsFetchResult(
                 success=True,
                 news_list=news_list,
                 source_api=source_name,
             )
             
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            if etag or last_modified:
+                with _RSS_CACHE_LOCK:
+                    _RSS_CACHE[url] = (etag, last_modified, result)
+            
+            return result
+            
         except requests.RequestException as e:
             return NewsFetchResult(
                 success=False,
@@ -142,13 +148,90 @@ class GoogleNewsClient:
                 source_api=source_name,
             )
     
+    def _parse_items(self, content: bytes) -> Optional[List[NewsDTO]]:
+        """RSS全体を読み込んで item を変換（channel がなければ None）"""
+        root = ET.fromstring(content)
+        channel = root.find("channel")
+        
+        if channel is None:
+            return None
+        
+        news_list = []
+        for item in channel.findall("item"):
+            dto = self._item_to_dto(item)
+            if dto is not None:
+                news_list.append(dto)
+        return news_list
+    
+    def _parse_items_streaming(self, content: bytes) -> Optional[List[NewsDTO]]:
+        """
+        item 要素ごとにストリーミングで変換（lxml使用、channel がなければ None）
+        
+        変換済みの要素は都度解放し、DOM全体を保持しない
+        """
+        news_list = []
+        has_channel = False
+        
+        for _, elem in lxml_etree.iterparse(
+            BytesIO(content), events=("end",), tag=("item", "channel"),
+            resolve_entities=False,
+        ):
+            parent = elem.getparent()
+            
+            if elem.tag == "channel":
+                has_channel = has_channel or _is_root(parent)
+                continue
+            
+            # ルート直下の channel 直下にある item のみ対象（ET版と同じ条件）
+            if parent is None or parent.tag != "channel" or not _is_root(parent.getparent()):
+                continue
+            
+            dto = self._item_to_dto(elem)
+            if dto is not None:
+                news_list.append(dto)
+            
+            # 処理済みの item と先行する兄弟要素を解放
+            elem.clear()
+            while elem.getprevious() is not None:
+                del parent[0]
+        
+        return news_list if has_channel else None
+    
+    def _item_to_dto(self, item) -> Optional[NewsDTO]:
+        """RSS の item 要素を NewsDTO に変換（タイトルが空・変換失敗時は None）"""
+        try:
+            title = item.find("title")
+            link = item.find("link")
+            pub_date = item.find("pubDate")
+            source = item.find("source")
+            description = item.find("description")
+            
+            # 日時パース
+            published_at = datetime.now()
+            if pub_date is not None and pub_date.text:
+                try:
+                    published_at = _parse_pub_date(pub_date.text)
+                except (TypeError, ValueError):
+                    pass
+            
+            dto = NewsDTO(
+                title=title.text if title is not None else "",
+                description=description.text if description is not None else "",
+                source_name=source.text if source is not None else "Google News",
+                published_at=published_at,
+                region="foreign",
+                url=link.text if link is not None else None,
+            )
+            
+            if dto.title.strip():
+                return dto
+        except Exception:
+            pass
+        return None
+    
     def _is_economy_related(self, title: str) -> bool:
         """タイトルが経済関連かどうかを判定"""
-        title_lower = title.lower()
-        for keyword in self.ECONOMY_KEYWORDS:
-            if keyword.lower() in title_lower:
-                return True
-        return False
+        return _ECONOMY_MATCHER.contains(title.lower())
     
     def fetch_economy_news(self) -> NewsFetchResult:
         """
@@ -158,8 +241,8 @@ class GoogleNewsClient:
         seen_urls = set()
         filtered_count = 0
         
-        # 並列でクエリを実行（最大3スレッド）
-        with ThreadPoolExecutor(max_workers=3) as executor:
+        # 並列でクエリを実行（全クエリを同時に発行し、待ち時間を重ねる）
+        with ThreadPoolExecutor(max_workers=len(self.SEARCH_QUERIES)) as executor:
             futures = {executor.submit(self.search, query): query for query in self.SEARCH_QUERIES}
             
             for future in as_completed(futures, timeout=30):
@@ -167,12 +250,15 @@ class GoogleNewsClient:
                     result = future.result(timeout=10)
                     if result.success:
                         for news in result.news_list:
-                            if news.url and news.url not in seen_urls:
-                                if self._is_economy_related(news.title):
-                                    all_news.append(news)
-                                    seen_urls.add(news.url)
-                                else:
-                                    filtered_count += 1
+                            # 重複（他クエリで判定済み）は除外判定の結果に関わらずスキップ
+                            if not news.url or news.url in seen_urls:
+                                continue
+                            seen_urls.add(news.url)
+                            
+                            if self._is_economy_related(news.title):
+                                all_news.append(news)
+                            else:
+                                filtered_count += 1
                 except Exception:
                     continue
         
@@ -190,12 +276,38 @@ class GoogleNewsClient:
         return self.fetch_economy_news()
 
 
+def _parse_pub_date(text: str) -> datetime:
+    """
+    RSS の pubDate（RFC 822形式）を解析
+    
+    "+0000" 等の数値オフセットにも対応し、従来どおり UTC の naive datetime で返す
+    """
+    published_at = parsedate_to_datetime(text)
+    if published_at.tzinfo is not None:
+        published_at = published_at.astimezone(timezone.utc).replace(tzinfo=None)
+    return published_at
+
+
+def _is_root(elem) -> bool:
+    """lxml 要素がドキュメントのルート要素か"""
+    return elem is not None and elem.getparent() is None
+
+
+# 経済関連キーワードを1回の走査で判定するマッチャー
+_ECONOMY_MATCHER = KeywordMatcher(
+    [(kw, None) for kw in GoogleNewsClient.ECONOMY_KEYWORDS],
+    lower=True,
+)
+
+
+@ttl_cache(15 * 60, cache_if=lambda result: result.success)
 def fetch_google_news() -> NewsFetchResult:
     """Google Newsからビジネスニュースを取得（簡易関数）"""
     client = GoogleNewsClient()
     return client.fetch_top_stories("BUSINESS")
 
 
+@ttl_cache(15 * 60, cache_if=lambda result: result.success)
 def fetch_google_economy_news() -> NewsFetchResult:
     """Google Newsから経済関連ニュースを取得（簡易関数）"""
     client = GoogleNewsClient()
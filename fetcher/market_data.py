@@ -3,10 +3,21 @@
 
 リアルタイムの為替レート、国債利回り等を取得
 """
+import threading
 import yfinance as yf
-from typing import Dict, Any, Optional
-from datetime import datetime
-from dataclasses import dataclass
+from typing import Dict, Any, List, Optional
+from datetime import datetime, timezone
+from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor
+
+from config import QUOTE_CACHE_TTL, HISTORY_CACHE_TTL, HISTORY_OPEN_CACHE_TTL
+from .file_cache import FileCache
+
+# レート制限の例外（yfinance 0.2.52 以降のみ定義）
+try:
+    from yfinance.exceptions import YFRateLimitError
+except ImportError:
+    YFRateLimitError = None
 
 
 @dataclass
@@ -62,14 +73,44 @@ class MarketDataFetcher:
                     "description": "仮想通貨。リスク選好の指標"},
     }
     
+    def __init__(self):
+        # レート制限を一度検知したら、この取得中の残りのシンボルは問い合わせない
+        self._rate_limited = threading.Event()
+    
     def fetch_quote(self, symbol: str) -> Optional[MarketQuote]:
-        """単一シンボルのクォートを取得"""
+        """単一シンボルのクォートを取得（QUOTE_CACHE_TTL 秒以内の取得結果は再利用）"""
+        cache_key = f"quote:{symbol}"
+        cached = _CACHE.get(cache_key, QUOTE_CACHE_TTL)
+        if cached is not None:
+            cached["timestamp"] = datetime.fromisoformat(cached["timestamp"])
+            return MarketQuote(**cached)
+        
+        quote = self._fetch_quote(symbol)
+        if quote:
+            _CACHE.set(cache_key, {**asdict(quote), "timestamp": quote.timestamp.isoformat()})
+        return quote
+    
+    def _on_error(self, e: Exception, message: str) -> None:
+        """取得エラーを出力（レート制限は最初の1回のみ出力して以降の取得を止める）"""
+        if _is_rate_limited(e):
+            if not self._rate_limited.is_set():
+                self._rate_limited.set()
+                print(f"[MarketData] Rate limited, skipping remaining symbols: {e}")
+            return
+        print(f"{message}: {e}")
+    
+    def _fetch_quote(self, symbol: str) -> Optional[MarketQuote]:
+        """単一シンボルのクォートを yfinance から取得"""
+        if self._rate_limited.is_set():
+            return None
+        
         try:
             ticker = yf.Ticker(symbol)
             info = ticker.fast_info
             
-            price = info.get("lastPrice", 0) or info.get("regularMarketPrice", 0)
-            prev_close = info.get("previousClose", 0) or info.get("regularMarketPreviousClose", 0)
+            # 属性を直接参照（キー名 → 属性名の変換を経由しない）
+            price = _fast_info_value(info, "last_price")
+            prev_close = _fast_info_value(info, "previous_close", "regular_market_previous_close")
             
             if price == 0:
                 # fast_infoで取得できない場合はhistoryから
@@ -93,32 +134,33 @@ class MarketDataFetcher:
                 timestamp=datetime.now(),
             )
         except Exception as e:
-            print(f"[MarketData] Error fetching {symbol}: {e}")
+            self._on_error(e, f"[MarketData] Error fetching {symbol}")
             return None
     
     def fetch_all(self) -> Dict[str, Any]:
         """全シンボルのデータを取得"""
-        result = {
-            "fx": [],
-            "bonds": [],
-            "risk": [],
-            "commodity": [],
-            "index": [],
-            "crypto": [],
-            "timestamp": datetime.now().isoformat(),
-        }
+        result = _new_result()
         
-        for symbol, info in self.SYMBOLS.items():
-            quote = self.fetch_quote(symbol)
-            if quote:
-                category = info.get("category", "other")
-                if category in result:
-                    result[category].append(quote.to_dict())
+        # 全シンボルを並列に取得（結果はシンボル定義順で返る）
+        with ThreadPoolExecutor(max_workers=_max_workers(len(self.SYMBOLS))) as executor:
+            quotes = list(executor.map(self.fetch_quote, self.SYMBOLS))
+        
+        for symbol, quote in zip(self.SYMBOLS, quotes):
+            category = _RESULT_CATEGORY.get(symbol)
+            if quote and category:
+                result[category].append(quote.to_dict())
         
         return result
     
     def fetch_history(self, symbol: str, period: str = "1mo") -> list:
-        """日足ヒストリカルデータを取得"""
+        """日足ヒストリカルデータを取得（_history_cache_ttl 秒以内の取得結果は再利用）"""
+        cache_key = f"history:{symbol}:{period}"
+        cached = _CACHE.get(cache_key, _history_cache_ttl(symbol))
+        if cached is not None:
+            return cached
+        if self._rate_limited.is_set():
+            return []
+        
         try:
             ticker = yf.Ticker(symbol)
             hist = ticker.history(period=period)
@@ -126,18 +168,52 @@ class MarketDataFetcher:
             if hist.empty:
                 return []
             
-            # Chart.js用のデータ形式に変換
-            data = []
-            for date, row in hist.iterrows():
-                data.append({
-                    "date": date.strftime("%m/%d"),
-                    "close": round(row["Close"], 4),
-                })
+            data = _to_chart_data(hist["Close"])
+            _CACHE.set(cache_key, data)
             return data
         except Exception as e:
-            print(f"[MarketData] Error fetching history for {symbol}: {e}")
+            self._on_error(e, f"[MarketData] Error fetching history for {symbol}")
             return []
     
+    def fetch_histories(self, symbols: List[str], period: str = "1mo") -> Dict[str, list]:
+        """
+        複数シンボルの日足ヒストリカルデータを1回のリクエストでまとめて取得
+        
+        Returns:
+            シンボル → fetch_history と同じ形式のリスト
+            （取得できなかったシンボルは含まない）
+        """
+        histories = {}
+        for symbol in symbols:
+            cached = _CACHE.get(f"history:{symbol}:{period}", _history_cache_ttl(symbol))
+            if cached is not None:
+                histories[symbol] = cached
+        
+        # キャッシュにないシンボルのみダウンロード
+        missing = [symbol for symbol in symbols if symbol not in histories]
+        if not missing or self._rate_limited.is_set():
+            return histories
+        
+        try:
+            frame = yf.download(
+                missing, period=period, group_by="ticker",
+                auto_adjust=True, threads=True, progress=False,
+            )
+        except Exception as e:
+            self._on_error(e, "[MarketData] Error fetching histories")
+            return histories
+        
+        for symbol in missing:
+            try:
+                # 取引日が異なるシンボルの行は欠損値になるため除外
+                closes = frame[symbol]["Close"].dropna()
+            except Exception:
+                continue
+            if not closes.empty:
+                histories[symbol] = _to_chart_data(closes)
+                _CACHE.set(f"history:{symbol}:{period}", histories[symbol])
+        return histories
+    
     def _calc_weekly_change(self, history: list) -> tuple:
         """週間変動を計算（5営業日前との比較）"""
         if len(history) < 5:
@@ -150,20 +226,21 @@ class MarketDataFetcher:
     
     def fetch_all_with_history(self) -> Dict[str, Any]:
         """全シンボルのデータ + ヒストリカルデータを取得"""
-        result = {
-            "fx": [],
-            "bonds": [],
-            "risk": [],
-            "commodity": [],
-            "index": [],
-            "crypto": [],
-            "timestamp": datetime.now().isoformat(),
-        }
+        result = _new_result()
         
-        for symbol, info in self.SYMBOLS.items():
-            quote = self.fetch_quote(symbol)
-            history = self.fetch_history(symbol, period="1mo")
+        # ヒストリカルは全シンボル分を一括取得し、その間にクォートを並列に取得
+        symbols = list(self.SYMBOLS)
+        with ThreadPoolExecutor(max_workers=_max_workers(len(symbols))) as executor:
+            histories_future = executor.submit(self.fetch_histories, symbols, "1mo")
+            quotes = list(executor.map(self.fetch_quote, symbols))
+            histories = histories_future.result()
             
+            # 一括取得できなかったシンボルのみ個別に取得
+            missing = [symbol for symbol in symbols if symbol not in histories]
+            histories.update(zip(missing, executor.map(self.fetch_history, missing)))
+        
+        for (symbol, info), quote in zip(self.SYMBOLS.items(), quotes):
+            history = histories[symbol]
             if quote:
                 quote_dict = quote.to_dict()
                 quote_dict["history"] = history
@@ -174,8 +251,8 @@ class MarketDataFetcher:
                 quote_dict["weekly_change"] = weekly_change
                 quote_dict["weekly_change_percent"] = weekly_change_pct
                 
-                category = info.get("category", "other")
-                if category in result:
+                category = _RESULT_CATEGORY.get(symbol)
+                if category:
                     result[category].append(quote_dict)
         
         # 日米金利差（10年）を計算
@@ -205,12 +282,100 @@ class MarketDataFetcher:
     
     def fetch_us_bonds(self) -> Dict[str, Optional[MarketQuote]]:
         """米国債利回りを取得"""
-        return {
-            "10y": self.fetch_quote("^TNX"),
-            "30y": self.fetch_quote("^TYX"),
-            "5y": self.fetch_quote("^FVX"),
-            "3m": self.fetch_quote("^IRX"),
+        bonds = {
+            "10y": "^TNX",
+            "30y": "^TYX",
+            "5y": "^FVX",
+            "3m": "^IRX",
         }
+        with ThreadPoolExecutor(max_workers=_max_workers(len(bonds))) as executor:
+            quotes = executor.map(self.fetch_quote, bonds.values())
+            return dict(zip(bonds, quotes))
+
+
+# 結果の分類キー
+_RESULT_KEYS = ("fx", "bonds", "risk", "commodity", "index", "crypto")
+
+# シンボル → 結果の分類キー（分類キーにないカテゴリのシンボルは含まない）
+_RESULT_CATEGORY = {
+    symbol: info["category"]
+    for symbol, info in MarketDataFetcher.SYMBOLS.items()
+    if info.get("category") in _RESULT_KEYS
+}
+
+
+def _new_result() -> Dict[str, Any]:
+    """分類ごとの空リストを持つ結果辞書を生成"""
+    result: Dict[str, Any] = {key: [] for key in _RESULT_KEYS}
+    result["timestamp"] = datetime.now().isoformat()
+    return result
+
+
+# クォート・ヒストリカルの取得結果キャッシュ
+_CACHE = FileCache("market")
+
+# 週末も取引されるシンボル（ヒストリカルを長く保持しない）
+_ALWAYS_TRADING = frozenset(
+    symbol for symbol, info in MarketDataFetcher.SYMBOLS.items()
+    if info.get("category") == "crypto"
+)
+
+
+def _to_chart_data(closes) -> list:
+    """終値の系列（pandas.Series）を Chart.js 用のデータ形式に変換"""
+    # 日付の整形と丸めは系列単位でまとめて行い、要素ごとの処理は辞書化のみ
+    dates = closes.index.strftime("%m/%d").tolist()
+    values = closes.round(4).tolist()
+    return [{"date": date, "close": close} for date, close in zip(dates, values)]
+
+
+def _is_weekend_closed(now: Optional[datetime] = None) -> bool:
+    """週末の休場中か（UTC 金曜22時〜日曜21時。為替・株式・債券・先物が動かない時間帯）"""
+    now = now or datetime.now(timezone.utc)
+    weekday, hour = now.weekday(), now.hour
+    return (weekday == 4 and hour >= 22) or weekday == 5 or (weekday == 6 and hour < 21)
+
+
+def _history_cache_ttl(symbol: str, now: Optional[datetime] = None) -> float:
+    """
+    日足ヒストリカルのキャッシュ有効期間
+    
+    取引時間中は当日の足（終値）が更新され、週間変動やチャートの最新値が
+    クォートからずれるため、クォートと同程度の短い期間のみ再利用する
+    """
+    if symbol in _ALWAYS_TRADING or not _is_weekend_closed(now):
+        return HISTORY_OPEN_CACHE_TTL
+    return HISTORY_CACHE_TTL
+
+
+def _fast_info_value(info, *attrs: str) -> float:
+    """
+    fast_info から最初に取得できた値を返す（どれも取得できなければ 0）
+    
+    シンボルによっては項目が欠けており、属性の参照自体が KeyError 等を送出するため、
+    欠損は 0 として扱い history へのフォールバックに回す
+    """
+    for attr in attrs:
+        try:
+            value = getattr(info, attr)
+        except (KeyError, TypeError, ValueError, IndexError, AttributeError):
+            continue
+        if value:
+            return value
+    return 0
+
+
+def _is_rate_limited(e: Exception) -> bool:
+    """Yahoo Finance のレート制限（HTTP 429）による例外か"""
+    if YFRateLimitError is not None and isinstance(e, YFRateLimitError):
+        return True
+    response = getattr(e, "response", None)
+    return getattr(response, "status_code", None) == 429
+
+
+def _max_workers(n: int) -> int:
+    """並列取得のスレッド数（シンボル数まで、最大16）"""
+    return max(1, min(16, n))
 
 
 def get_market_data(include_history: bool = True) -> Dict[str, Any]:
@@ -4,10 +4,15 @@ NewsAPI クライアント
 """
 import os
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import List, Optional
 
+from config import NEWSAPI_CACHE_TTL
 from models import NewsDTO, NewsFetchResult
+from utils.jsonio import json_loads
+from .common import get_session
+from .file_cache import FileCache
 
 
 class NewsAPIClient:
@@ -24,6 +29,9 @@ class NewsAPIClient:
         "dollar yen", "yen", "forex", "currency intervention", "rate check",
     ]
     
+    # fetch_everything の既定クエリ（最初の5キーワード）
+    DEFAULT_QUERY = " OR ".join(KEYWORDS[:5])
+    
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key or os.getenv("NEWSAPI_KEY")
         if not self.api_key:
@@ -42,13 +50,10 @@ class NewsAPIClient:
             params = {
                 "country": country,
                 "category": category,
-                "apiKey": self.api_key,
                 "pageSize": 20,
             }
             
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
+            data = self._get_json(url, params)
             
             if data.get("status") != "ok":
                 return NewsFetchResult(
@@ -65,7 +70,7 @@ class NewsAPIClient:
                 source_api="NewsAPI",
             )
             
-        except requests.RequestException as e:
+        except (requests.RequestException, ValueError) as e:
             return NewsFetchResult(
                 success=False,
                 error_message=str(e),
@@ -85,7 +90,7 @@ class NewsAPIClient:
             
             # クエリ構築
             if query is None:
-                query = " OR ".join(self.KEYWORDS[:5])  # 最初の5キーワード
+                query = self.DEFAULT_QUERY
             
             from_date = (datetime.now() - timedelta(days=days_back)).strftime("%Y-%m-%d")
             
@@ -94,13 +99,10 @@ class NewsAPIClient:
                 "from": from_date,
                 "language": "en",
                 "sortBy": "relevancy",
-                "apiKey": self.api_key,
                 "pageSize": 30,
             }
             
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
+            data = self._get_json(url, params)
             
             if data.get("status") != "ok":
                 return NewsFetchResult(
@@ -117,13 +119,32 @@ class NewsAPIClient:
                 source_api="NewsAPI",
             )
             
-        except requests.RequestException as e:
+        except (requests.RequestException, ValueError) as e:
             return NewsFetchResult(
                 success=False,
                 error_message=str(e),
                 source_api="NewsAPI",
             )
     
+    def _get_json(self, url: str, params: dict) -> dict:
+        """API を呼び出して応答 JSON を取得（NEWSAPI_CACHE_TTL 秒以内の同一リクエストは再利用）"""
+        cache_key = url + "?" + "&".join(f"{k}={v}" for k, v in sorted(params.items()))
+        data = _CACHE.get(cache_key, NEWSAPI_CACHE_TTL)
+        if data is not None:
+            return data
+        
+        # APIキーはクエリではなくヘッダーで渡す（キャッシュキー・URLに含めない）
+        response = get_session().get(
+            url, params=params, headers={"X-Api-Key": self.api_key}, timeout=10,
+        )
+        response.raise_for_status()
+        data = json_loads(response.content)
+        
+        # エラー応答は保存しない
+        if data.get("status") == "ok":
+            _CACHE.set(cache_key, data)
+        return data
+    
     def _parse_articles(self, articles: List[dict], region: str = "foreign") -> List[NewsDTO]:
         """APIレスポンスをNewsDTOに変換"""
         news_list = []
@@ -158,6 +179,10 @@ class NewsAPIClient:
         return news_list
 
 
+# NewsAPI 応答のキャッシュ
+_CACHE = FileCache("newsapi")
+
+
 def fetch_news(api_key: Optional[str] = None) -> NewsFetchResult:
     """
     ニュースを取得（簡易関数）
@@ -166,47 +191,38 @@ def fetch_news(api_key: Optional[str] = None) -> NewsFetchResult:
     Returns:
         NewsFetchResult
     """
-    all_news = []
-    existing_urls = set()
+    from .googlenews_client import GoogleNewsClient
     
-    # 1. NewsAPI ビジネストップヘッドライン
-    try:
-        client = NewsAPIClient(api_key)
-        headlines = client.fetch_top_headlines(country="us", category="business")
-        for news in headlines.news_list:
-            if news.url and news.url not in existing_urls:
-                all_news.append(news)
-                existing_urls.add(news.url)
-    except Exception:
-        pass  # NewsAPIが失敗してもGoogle Newsで続行
+    def fetch_headlines() -> NewsFetchResult:
+        return NewsAPIClient(api_key).fetch_top_headlines(country="us", category="business")
     
-    # 2. Google News 為替関連検索（追加ソース）
-    try:
-        from .googlenews_client import GoogleNewsClient
-        google_client = GoogleNewsClient()
-        forex_result = google_client.fetch_forex_news()
-        
-        if forex_result.success:
-            for news in forex_result.news_list:
-                if news.url and news.url not in existing_urls:
-                    all_news.append(news)
-                    existing_urls.add(news.url)
-    except Exception:
-        pass  # Google Newsが失敗してもNewsAPIの結果は返す
+    google_client = GoogleNewsClient()
     
+    # 各ソースは独立しているため並列に取得し、待ち時間を重ねる
+    # 1. NewsAPI ビジネストップヘッドライン
+    # 2. Google News 為替関連検索（追加ソース）
     # 3. Google News ビジネストップ（追加ソース）
-    try:
-        from .googlenews_client import GoogleNewsClient
-        google_client = GoogleNewsClient()
-        google_top = google_client.fetch_top_stories("BUSINESS")
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [
+            executor.submit(fetch_headlines),
+            executor.submit(google_client.fetch_forex_news),
+            executor.submit(google_client.fetch_top_stories, "BUSINESS"),
+        ]
+    
+    # 重複時に優先するソースが変わらないよう、上記の順にマージする
+    all_news = []
+    existing_urls = set()
+    for future in futures:
+        try:
+            result = future.result()
+        except Exception:
+            continue  # 失敗したソースは飛ばして他のソースで続行
         
-        if google_top.success:
-            for news in google_top.news_list:
+        if result.success:
+            for news in result.news_list:
                 if news.url and news.url not in existing_urls:
                     all_news.append(news)
                     existing_urls.add(news.url)
-    except Exception:
-        pass
     
     if not all_news:
         return NewsFetchResult(
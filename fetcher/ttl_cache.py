@@ -0,0 +1,48 @@
+"""
+取得結果の短期キャッシュモジュール
+
+外部サイトへの同一リクエストを一定時間まとめる
+- 経済指標やニュース一覧は数分単位では変化しないため、TTL内は前回結果を返す
+- 返り値は呼び出し元で共有されるため、変更しないこと
+"""
+import threading
+import time
+from functools import wraps
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+def ttl_cache(ttl: float, cache_if: Optional[Callable[[Any], bool]] = None):
+    """
+    引数ごとに結果を ttl 秒間キャッシュするデコレータ
+
+    Args:
+        ttl: キャッシュ有効期間（秒）
+        cache_if: 結果を受け取り、キャッシュしてよいかを返す関数
+                  （取得失敗時の結果を保持しないため。省略時は常にキャッシュ）
+    """
+    def decorator(func: Callable) -> Callable:
+        cache: Dict[Tuple, Tuple[float, Any]] = {}
+        lock = threading.Lock()
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+
+            with lock:
+                entry = cache.get(key)
+                if entry is not None and now - entry[0] < ttl:
+                    return entry[1]
+
+            # 取得処理はロック外で実行（同時に期限切れになった場合は重複取得を許容）
+            result = func(*args, **kwargs)
+
+            if cache_if is None or cache_if(result):
+                with lock:
+                    cache[key] = (time.monotonic(), result)
+            return result
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator
@@ -80,7 +80,7 @@ def main():
     print(f"   ✓ 分類完了: {len(classified)}件")
     
     # スコアリング
-    scored = score_news_batch(classified)
+    scored = score_news_batch(classified, inplace=True)
     print(f"   ✓ スコアリング完了")
     
     # 集計
@@ -109,8 +109,8 @@ def main():
     zero_count = aggregates.get("zero_score_count", 0)
     zero_ratio = (zero_count / news_count * 100) if news_count > 0 else 0
     
-    plus2_count = sum(1 for n in scored if n.get("impact_score", 0) >= 2)
-    minus2_count = sum(1 for n in scored if n.get("impact_score", 0) <= -2)
+    plus2_count = aggregates.get("plus2_count", 0)
+    minus2_count = aggregates.get("minus2_count", 0)
     plus2_ratio = (plus2_count / news_count * 100) if news_count > 0 else 0
     minus2_ratio = (minus2_count / news_count * 100) if news_count > 0 else 0
     
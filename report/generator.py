@@ -10,8 +10,9 @@
 """
 from datetime import datetime
 from typing import Dict, Any, List, Optional
-from collections import Counter
+from collections import Counter, defaultdict
 from config import get_log_filename
+from utils.sequences import first_unique
 
 
 def generate_report(
@@ -126,15 +127,14 @@ def generate_report(
     report_lines.append("")
     
     # 政治発言（高優先度のみ）
-    high_priority_political = _filter_high_priority_political(political_events)
+    # ※ 辞書化は1イベントにつき1回だけ行い、以降の集計で使い回す
+    political_dicts = _political_event_dicts(political_events)
+    high_priority_political = _filter_high_priority_political(political_dicts)
     report_lines.append("   🟠 政治発言（条件付き高優先）")
     if high_priority_political:
-        for event in high_priority_political:
-            event_dict = event.to_dict() if hasattr(event, 'to_dict') else event
-            context = event_dict.get("context", "")
-            if context in ["金融政策", "関税政策", "貿易政策"]:
-                report_lines.append(f"      ・{event_dict.get('speaker', '不明')}: {event_dict.get('summary', '不明')}")
-                has_any_priority = True
+        for event_dict in high_priority_political:
+            report_lines.append(f"      ・{event_dict.get('speaker', '不明')}: {event_dict.get('summary', '不明')}")
+            has_any_priority = True
     
     if not high_priority_political:
         report_lines.append("      ・金融政策・関税関連の発言: 本日は該当ニュースなし")
@@ -210,10 +210,13 @@ def generate_report(
     report_lines.append("")
     
     # ===== 6. 評価保留ニュースの内訳 =====
-    zero_news = [n for n in scored_news_list if n.get("impact_score", 0) == 0]
-    if zero_news:
-        reason_counts = Counter(n.get("score_reason", "不明") for n in zero_news)
-        
+    # ±0 の抽出と理由の集計を1回の走査で行う（中間リストを作らない）
+    reason_counts = Counter(
+        n.get("score_reason", "不明")
+        for n in scored_news_list
+        if n.get("impact_score", 0) == 0
+    )
+    if reason_counts:
         report_lines.extend([
             "┌─────────────────────────────────────────────────────┐",
             "│ 【評価保留ニュースの内訳】                             │",
@@ -221,10 +224,12 @@ def generate_report(
             "└─────────────────────────────────────────────────────┘",
         ])
         
-        for reason, count in reason_counts.most_common():
+        sorted_reasons = reason_counts.most_common()
+        for reason, count in sorted_reasons:
             report_lines.append(f"   ・{reason}: {count}件")
         
-        summary_comment = _generate_zero_summary(reason_counts)
+        # 件数順に並べた先頭が最多の理由（同数なら先に出現した理由）
+        summary_comment = _generate_zero_summary(sorted_reasons[0][0])
         report_lines.append("")
         report_lines.append(f"   → {summary_comment}")
         report_lines.append("")
@@ -250,7 +255,7 @@ def generate_report(
     report_lines.append("")
     
     # ===== 9. 重要人物の発言 =====
-    if political_events:
+    if political_dicts:
         report_lines.extend([
             "┌─────────────────────────────────────────────────────┐",
             "│ 【重要人物の発言（参考情報）】                         │",
@@ -258,12 +263,12 @@ def generate_report(
             "└─────────────────────────────────────────────────────┘",
         ])
         
-        grouped = _group_political_events(political_events)
+        grouped = _group_political_events(political_dicts)
         
         for speaker, data in grouped.items():
             themes = ", ".join([f"{t}（{c}件）" for t, c in data["themes"].items()])
-            summaries = list(set(data["summaries"]))[:3]
-            sources = ", ".join(list(set(data["sources"]))[:3])
+            summaries = first_unique(data["summaries"], 3)
+            sources = ", ".join(first_unique(data["sources"], 3))
             
             report_lines.append(f"   - 発言者: {speaker}")
             report_lines.append(f"     主なテーマ: {themes}")
@@ -313,17 +318,17 @@ def generate_report(
             f"  内容: {text}...",
         ])
     
-    details = "\n".join(detail_lines)
+    # 本文と詳細を1つの文字列にまとめ、保存と戻り値で共用する
+    full_report = report + "\n".join(detail_lines)
     
     # ファイル保存
     if save_to_file:
         log_path = get_log_filename()
         with open(log_path, "w", encoding="utf-8") as f:
-            f.write(report)
-            f.write(details)
+            f.write(full_report)
         print(f"\n📁 レポート保存: {log_path}")
     
-    return report + details
+    return full_report
 
 
 def _generate_one_liner(total: float, zero_ratio: float, priority_macro) -> str:
@@ -348,10 +353,8 @@ def _generate_one_liner(total: float, zero_ratio: float, priority_macro) -> str:
             return "今日は「特に大きな動きがない日」です。"
 
 
-def _generate_zero_summary(reason_counts: Counter) -> str:
-    """評価保留の内訳まとめコメントを生成"""
-    top_reason = reason_counts.most_common(1)[0][0] if reason_counts else ""
-    
+def _generate_zero_summary(top_reason: str) -> str:
+    """評価保留の内訳まとめコメントを生成（top_reason: 最も多い保留理由）"""
     if "定性的情報" in top_reason or "価格材料不足" in top_reason:
         return "今日は「話題は多いが、市場全体の判断材料になりにくいニュース」が中心でした。"
     elif "市場全体への波及" in top_reason:
@@ -362,44 +365,49 @@ def _generate_zero_summary(reason_counts: Counter) -> str:
         return "今日は「判断に使いにくいニュースが多い」状況でした。"
 
 
-def _filter_high_priority_political(events: Optional[List]) -> List:
-    """高優先度の政治発言をフィルタリング"""
+def _political_event_dicts(events: Optional[List]) -> List[Dict[str, Any]]:
+    """政治発言（PoliticalEvent または辞書）を辞書のリストに変換"""
     if not events:
         return []
-    
+    return [event.to_dict() if hasattr(event, 'to_dict') else event for event in events]
+
+
+def _filter_high_priority_political(event_dicts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """高優先度の政治発言をフィルタリング"""
     high_priority = []
-    for event in events:
-        event_dict = event.to_dict() if hasattr(event, 'to_dict') else event
+    for event_dict in event_dicts:
         context = event_dict.get("context", "")
         if context in ["金融政策", "関税政策", "貿易政策"]:
-            high_priority.append(event)
+            high_priority.append(event_dict)
     
     return high_priority
 
 
-def _group_political_events(events: List) -> Dict[str, Any]:
+def _group_political_events(event_dicts: List[Dict[str, Any]]) -> Dict[str, Any]:
     """政治発言を発言者ごとにグループ化"""
-    grouped = {}
+    grouped = defaultdict(_new_political_group)
     
-    for event in events:
-        event_dict = event.to_dict() if hasattr(event, 'to_dict') else event
-        speaker = event_dict.get("speaker", "不明")
-        
-        if speaker not in grouped:
-            grouped[speaker] = {
-                "themes": Counter(),
-                "summaries": [],
-                "sources": [],
-            }
+    for event_dict in event_dicts:
+        # 発言者ごとのグループは1回の参照で取得（初出時は自動生成）
+        group = grouped[event_dict.get("speaker", "不明")]
         
         context = event_dict.get("context", "その他")
-        grouped[speaker]["themes"][context] += 1
-        grouped[speaker]["summaries"].append(event_dict.get("summary", ""))
-        grouped[speaker]["sources"].append(event_dict.get("source_name", ""))
+        group["themes"][context] += 1
+        group["summaries"].append(event_dict.get("summary", ""))
+        group["sources"].append(event_dict.get("source_name", ""))
     
     return grouped
 
 
+def _new_political_group() -> Dict[str, Any]:
+    """発言者ごとの集計の初期値"""
+    return {
+        "themes": Counter(),
+        "summaries": [],
+        "sources": [],
+    }
+
+
 def _generate_scenarios(total_score: float, zero_count: int, news_count: int, has_priority: bool) -> List[str]:
     """シナリオを生成"""
     scenarios = []
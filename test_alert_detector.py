@@ -0,0 +1,67 @@
+"""AlertDetector.detect_alerts_batch のテスト"""
+import random
+
+from alert import AlertDetector
+
+
+def _scores(seed, days):
+    rng = random.Random(seed)
+    return [
+        {
+            "total_score": rng.choice([rng.randint(-10, 10), round(rng.uniform(-5, 5), 1)]),
+            "domestic_foreign_gap": round(rng.uniform(-8, 8), 1),
+        }
+        for _ in range(days)
+    ]
+
+
+def _detect_sequentially(detector, scores_list):
+    results = []
+    for scores in scores_list:
+        results.append(detector.detect_alerts(scores))
+        detector.add_daily_score(scores)
+    return results
+
+
+def test_batch_matches_sequential_detection():
+    for seed in range(50):
+        scores_list = _scores(seed, 15)
+        expected = _detect_sequentially(AlertDetector(), scores_list)
+        assert AlertDetector().detect_alerts_batch(scores_list) == expected
+
+
+def test_batch_continues_from_existing_history():
+    history, replay = _scores(1, 5), _scores(2, 10)
+
+    sequential = AlertDetector()
+    _detect_sequentially(sequential, history)
+    expected = _detect_sequentially(sequential, replay)
+
+    detector = AlertDetector()
+    for scores in history:
+        detector.add_daily_score(scores)
+    assert detector.detect_alerts_batch(replay) == expected
+
+
+def test_batch_does_not_change_detector_state():
+    detector = AlertDetector()
+    for scores in _scores(3, 5):
+        detector.add_daily_score(scores)
+
+    current = {"total_score": 4, "domestic_foreign_gap": 0}
+    before = (
+        list(detector.history),
+        detector.get_moving_average(),
+        detector.get_moving_average(2),
+        detector.detect_alerts(current),
+    )
+
+    detector.detect_alerts_batch(_scores(4, 10))
+
+    after = (
+        list(detector.history),
+        detector.get_moving_average(),
+        detector.get_moving_average(2),
+        detector.detect_alerts(current),
+    )
+    assert after == before
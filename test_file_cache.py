@@ -0,0 +1,20 @@
+"""FileCache のテスト"""
+from fetcher.file_cache import FileCache
+
+
+def test_roundtrip(tmp_path):
+    cache = FileCache("test", tmp_path)
+    cache.set("key", {"value": [1, 2.5, "日本"]})
+    assert cache.get("key", ttl=60) == {"value": [1, 2.5, "日本"]}
+    assert cache.get("key", ttl=0) is None
+    assert cache.get("other", ttl=60) is None
+
+
+def test_corrupted_or_non_dict_entry_is_a_miss(tmp_path):
+    cache = FileCache("test", tmp_path)
+    cache.set("key", {"value": 1})
+    path = cache._path("key")
+
+    for raw in (b"[1, 2, 3]", b'"text"', b"null", b"{broken"):
+        path.write_bytes(raw)
+        assert cache.get("key", ttl=60) is None
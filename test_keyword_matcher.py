@@ -0,0 +1,69 @@
+"""KeywordMatcher の単語境界判定テスト"""
+import pytest
+
+from utils import keyword_matcher
+from utils.keyword_matcher import KeywordMatcher
+
+
+ENTRIES = [
+    ("fed", "fed"),
+    ("trade", "trade"),
+    ("tariff", "tariff"),
+    ("interest rate", "rate"),
+    ("関税", "tariff_ja"),
+]
+
+
+@pytest.fixture(params=[True, False], ids=["automaton", "fallback"])
+def matcher(request, monkeypatch):
+    """オートマトン使用時と部分文字列検索へのフォールバック時の両方で検証"""
+    if request.param and not keyword_matcher.AHOCORASICK_AVAILABLE:
+        pytest.skip("pyahocorasick がインストールされていません")
+    monkeypatch.setattr(keyword_matcher, "AHOCORASICK_AVAILABLE", request.param)
+
+    m = KeywordMatcher(ENTRIES, lower=True, word_boundary=True)
+    assert (m._automaton is not None) == request.param
+    return m
+
+
+@pytest.mark.parametrize("text, expected", [
+    # 前後が英数字でなければ一致
+    ("the fed raised rates", ["fed"]),
+    ("the fed's decision", ["fed"]),
+    ("(fed)", ["fed"]),
+    ("fed", ["fed"]),
+    ("trade war", ["trade"]),
+    ("trade.", ["trade"]),
+    ("interest rate hike", ["interest rate"]),
+    # 英数字に続く/続かれる位置では一致しない
+    ("federal reserve", []),
+    ("unfed", []),
+    ("fed2", []),
+    ("trademark dispute", []),
+    ("tradesman", []),
+    # 末尾の複数形 "s" のみ許容
+    ("new tariffs on steel", ["tariff"]),
+    ("trades fell", ["trade"]),
+    ("interest rates rose", ["interest rate"]),
+    ("feds", ["fed"]),
+    ("fedss", []),
+    # 英数字以外で始まる/終わるキーワードは境界判定しない
+    ("対中関税を発動", ["関税"]),
+    ("中国trade関税", ["trade", "関税"]),
+])
+def test_word_boundary(matcher, text, expected):
+    assert [kw for kw, _ in matcher.find(text)] == expected
+    assert matcher.contains(text) == bool(expected)
+
+
+def test_boundary_hit_after_rejected_occurrence(matcher):
+    # 最初の出現が境界外でも、後続の境界上の出現で一致する
+    assert matcher.find("federal fed") == [("fed", "fed")]
+    assert matcher.contains("federal fed")
+
+
+def test_without_word_boundary_matches_substrings(monkeypatch):
+    for available in (keyword_matcher.AHOCORASICK_AVAILABLE, False):
+        monkeypatch.setattr(keyword_matcher, "AHOCORASICK_AVAILABLE", available)
+        m = KeywordMatcher(ENTRIES, lower=True)
+        assert [kw for kw, _ in m.find("federal trademark")] == ["fed", "trade"]
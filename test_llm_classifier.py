@@ -0,0 +1,63 @@
+"""GeminiClassifier の類似記事検出テスト（Gemini API はスタブで置き換え）"""
+import json
+import random
+
+import pytest
+
+pytest.importorskip("google.generativeai")
+
+from analyzer import llm_classifier
+from analyzer.llm_classifier import GeminiClassifier
+
+
+class StubModel:
+    """固定の分類結果を返すモデル"""
+
+    calls = 0
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def generate_content(self, prompt):
+        StubModel.calls += 1
+        return type("Response", (), {"text": json.dumps({"category": "market", "impact_score": 2, "reason": "stub"})})()
+
+
+@pytest.fixture
+def classifier(monkeypatch):
+    monkeypatch.setattr(llm_classifier.genai, "configure", lambda **kwargs: None)
+    monkeypatch.setattr(llm_classifier.genai, "GenerativeModel", StubModel)
+    StubModel.calls = 0
+    return GeminiClassifier(api_key="test", cache_path=None)
+
+
+def _headline_pairs(seed, count):
+    """8語の見出しと、1〜2語だけ入れ替えた類似見出し（Jaccard係数 0.6 以上）の組"""
+    rng = random.Random(seed)
+    pairs = []
+    for i in range(count):
+        words = [f"w{i}x{j}" for j in range(8)]
+        variant = list(words)
+        for k in rng.sample(range(8), rng.choice([1, 2])):
+            variant[k] = f"v{i}x{k}"
+        pairs.append((" ".join(words), " ".join(variant)))
+    return pairs
+
+
+def test_similar_headlines_are_detected(classifier):
+    pairs = _headline_pairs(seed=0, count=200)
+    classifier.classify_batch([{"text": original} for original, _ in pairs])
+    assert StubModel.calls == len(pairs)
+
+    results = classifier.classify_batch([{"text": variant} for _, variant in pairs])
+
+    missed = [r["text"] for r in results if not r["score_reason"].startswith("[類似記事]")]
+    assert missed == []
+    assert StubModel.calls == len(pairs)
+
+
+def test_dissimilar_headline_is_classified(classifier):
+    classifier.classify_single("fed holds rates steady as inflation cools")
+    result = classifier.classify_single("oil prices jump after opec output cut")
+    assert not result.reason.startswith("[類似記事]")
+    assert StubModel.calls == 2
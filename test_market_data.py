@@ -0,0 +1,86 @@
+"""MarketDataFetcher のクォート取得テスト（yfinance への通信はスタブで置き換え）"""
+from datetime import datetime, timezone
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("yfinance")
+
+from fetcher import market_data
+from fetcher.file_cache import FileCache
+
+
+class StubFastInfo:
+    """指定した項目の参照で KeyError を送出する fast_info"""
+
+    def __init__(self, missing=(), **values):
+        self._missing = set(missing)
+        self._values = values
+
+    def __getattr__(self, name):
+        if name in self._missing:
+            raise KeyError(name)
+        return self._values.get(name)
+
+
+class StubTicker:
+    def __init__(self, fast_info, closes=()):
+        self.fast_info = fast_info
+        self._closes = list(closes)
+        self.history_calls = 0
+
+    def history(self, period="1mo"):
+        self.history_calls += 1
+        return pd.DataFrame({"Close": self._closes})
+
+
+@pytest.fixture
+def use_ticker(monkeypatch, tmp_path):
+    """yf.Ticker をスタブに差し替え、キャッシュは一時ディレクトリに置く"""
+    monkeypatch.setattr(market_data, "_CACHE", FileCache("market", tmp_path))
+
+    def install(ticker):
+        monkeypatch.setattr(market_data.yf, "Ticker", lambda symbol: ticker)
+        return ticker
+
+    return install
+
+
+def test_missing_previous_close_uses_next_field(use_ticker):
+    ticker = use_ticker(StubTicker(StubFastInfo(
+        missing={"previous_close"}, last_price=101.0, regular_market_previous_close=100.0,
+    )))
+
+    quote = market_data.MarketDataFetcher().fetch_quote("^GSPC")
+
+    assert quote is not None
+    assert quote.price == 101.0
+    assert quote.previous_close == 100.0
+    assert quote.change_percent == 1.0
+    assert ticker.history_calls == 0
+
+
+def test_missing_last_price_falls_back_to_history(use_ticker):
+    ticker = use_ticker(StubTicker(
+        StubFastInfo(missing={"last_price", "previous_close", "regular_market_previous_close"}),
+        closes=[200.0, 202.0],
+    ))
+
+    quote = market_data.MarketDataFetcher().fetch_quote("^N225")
+
+    assert quote is not None
+    assert quote.price == 202.0
+    assert quote.previous_close == 200.0
+    assert ticker.history_calls == 1
+
+
+def test_history_cache_ttl_is_short_while_markets_trade():
+    wednesday = datetime(2026, 10, 14, 15, tzinfo=timezone.utc)
+    saturday = datetime(2026, 10, 17, 12, tzinfo=timezone.utc)
+    sunday_evening = datetime(2026, 10, 18, 22, tzinfo=timezone.utc)
+
+    assert market_data._history_cache_ttl("^GSPC", wednesday) == market_data.HISTORY_OPEN_CACHE_TTL
+    assert market_data._history_cache_ttl("^GSPC", saturday) == market_data.HISTORY_CACHE_TTL
+    assert market_data._history_cache_ttl("USDJPY=X", sunday_evening) == market_data.HISTORY_OPEN_CACHE_TTL
+    # 暗号資産は週末も取引される
+    assert market_data._history_cache_ttl("BTC-USD", saturday) == market_data.HISTORY_OPEN_CACHE_TTL
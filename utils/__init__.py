@@ -0,0 +1,4 @@
+"""Utility package"""
+from .jsonio import json_dumps, json_loads
+from .keyword_matcher import KeywordMatcher, lower_text
+from .sequences import first_unique
@@ -0,0 +1,30 @@
+"""
+JSON 読み書きモジュール
+
+orjson が利用可能なら高速な C 実装で読み書きする（未インストール時は標準の json）
+"""
+import json
+from typing import Any
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def json_loads(raw: bytes) -> Any:
+    """JSONをデコード（失敗時は json.JSONDecodeError / ValueError）"""
+    # orjson.JSONDecodeError は json.JSONDecodeError のサブクラス
+    return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+
+
+def json_dumps(data: Any, indent: bool = False) -> bytes:
+    """JSONをUTF-8のバイト列にエンコード（変換できない値は TypeError）"""
+    if ORJSON_AVAILABLE:
+        # yfinance 由来の numpy 数値もそのまま保存できるようにする
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    return json.dumps(data, ensure_ascii=False, indent=2 if indent else None).encode("utf-8")
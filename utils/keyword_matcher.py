@@ -0,0 +1,132 @@
+"""
+キーワード一括マッチングモジュール
+
+複数キーワードの部分一致判定を1回の走査で行う
+- pyahocorasick が利用可能な場合は Aho–Corasick オートマトンを使用
+- 未インストール環境では従来どおり部分文字列検索にフォールバック
+- 英字キーワードは単語境界での一致に限定できる（"trade" が "trademark" に一致しない）
+"""
+from functools import lru_cache
+from typing import Any, Iterable, List, Tuple
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+class KeywordMatcher:
+    """複数キーワードを1パスで検出するマッチャー"""
+
+    def __init__(
+        self,
+        entries: Iterable[Tuple[str, Any]],
+        lower: bool = False,
+        word_boundary: bool = False,
+    ):
+        """
+        Args:
+            entries: (キーワード, ペイロード) のリスト（同一キーワードの重複登録可）
+            lower: True の場合、キーワードを小文字化して照合する
+                   （テキスト側は呼び出し元で小文字化しておくこと）
+            word_boundary: True の場合、英数字で始まる/終わるキーワードは
+                           前後が英数字でない位置でのみ一致とする
+                           （末尾の複数形 "s" は許容: "tariff" → "tariffs"）
+        """
+        self._word_boundary = word_boundary
+
+        # (照合キー, 元キーワード, ペイロード) を登録順で保持
+        self._entries: Tuple[Tuple[str, str, Any], ...] = tuple(
+            (kw.lower() if lower else kw, kw, payload) for kw, payload in entries
+        )
+
+        self._automaton = None
+        if AHOCORASICK_AVAILABLE and self._entries:
+            # 照合キーごとに登録インデックスをまとめる
+            indices_by_key = {}
+            for i, (key, _, _) in enumerate(self._entries):
+                indices_by_key.setdefault(key, []).append(i)
+
+            automaton = ahocorasick.Automaton()
+            for key, indices in indices_by_key.items():
+                automaton.add_word(key, (key, tuple(indices)))
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    def find(self, text: str) -> List[Tuple[str, Any]]:
+        """
+        テキストに含まれるキーワードを検出
+
+        Returns:
+            [(キーワード, ペイロード), ...]（登録順、重複なし）
+        """
+        if self._automaton is None:
+            if self._word_boundary:
+                return [
+                    (kw, payload) for key, kw, payload in self._entries
+                    if _find_at_boundary(text, key)
+                ]
+            return [(kw, payload) for key, kw, payload in self._entries if key in text]
+
+        hit = set()
+        word_boundary = self._word_boundary
+        for end, (key, indices) in self._automaton.iter(text):
+            if word_boundary and not _at_boundary(text, key, end + 1 - len(key)):
+                continue
+            hit.update(indices)
+
+        entries = self._entries
+        return [entries[i][1:] for i in sorted(hit)]
+
+    def contains(self, text: str) -> bool:
+        """テキストにいずれかのキーワードが含まれるか（最初の一致で打ち切り）"""
+        if self._automaton is None:
+            if self._word_boundary:
+                return any(_find_at_boundary(text, key) for key, _, _ in self._entries)
+            return any(key in text for key, _, _ in self._entries)
+
+        word_boundary = self._word_boundary
+        for end, (key, _) in self._automaton.iter(text):
+            if not word_boundary or _at_boundary(text, key, end + 1 - len(key)):
+                return True
+        return False
+
+
+def _is_word_char(ch: str) -> bool:
+    """英数字（ASCII）かどうか"""
+    return ch.isascii() and ch.isalnum()
+
+
+def _at_boundary(text: str, key: str, start: int) -> bool:
+    """text[start:] に出現した key が単語境界上にあるか"""
+    if _is_word_char(key[0]) and start > 0 and _is_word_char(text[start - 1]):
+        return False
+
+    end = start + len(key)
+    if _is_word_char(key[-1]) and end < len(text) and _is_word_char(text[end]):
+        # 複数形の "s" のみ許容
+        if text[end] != "s" or (end + 1 < len(text) and _is_word_char(text[end + 1])):
+            return False
+    return True
+
+
+def _find_at_boundary(text: str, key: str) -> bool:
+    """key が単語境界上に1回以上出現するか"""
+    start = text.find(key)
+    while start != -1:
+        if _at_boundary(text, key, start):
+            return True
+        start = text.find(key, start + 1)
+    return False
+
+
+@lru_cache(maxsize=1024)
+def lower_text(text: str) -> str:
+    """
+    小文字化したテキストを取得
+
+    同じ記事本文を複数の検知器で照合するため、直近の結果を使い回す
+    （ニュース辞書にはキーを追加しない）
+    """
+    return text.lower()
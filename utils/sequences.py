@@ -0,0 +1,21 @@
+"""
+シーケンス操作モジュール
+
+レポート生成と Web API の両方で使うリスト処理をまとめる
+"""
+from typing import Hashable, Iterable, List, TypeVar
+
+T = TypeVar("T", bound=Hashable)
+
+
+def first_unique(items: Iterable[T], n: int) -> List[T]:
+    """重複を除いた先頭 n 件を出現順で取得（n 件そろった時点で打ち切り）"""
+    seen = set()
+    result = []
+    for item in items:
+        if item not in seen:
+            seen.add(item)
+            result.append(item)
+            if len(result) >= n:
+                break
+    return result
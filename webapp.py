@@ -27,6 +27,7 @@ from fetcher import fetch_news
 from fetcher.market_data import get_market_data
 from fetcher.economic_calendar import get_economic_indicators
 from data import get_history_manager
+from utils.sequences import first_unique
 
 # LLM分類器（利用可能な場合）
 try:
@@ -76,7 +77,7 @@ def generate_dashboard_data():
             
             llm_scored = classify_with_llm(llm_batch)
             keyword_classified = classify_news_batch(keyword_batch)
-            keyword_scored = score_news_batch(keyword_classified)
+            keyword_scored = score_news_batch(keyword_classified, inplace=True)
             
             scored = llm_scored + keyword_scored
         
@@ -84,7 +85,7 @@ def generate_dashboard_data():
     else:
         # 従来のキーワードベース分類
         classified = classify_news_batch(news_list)
-        scored = score_news_batch(classified)
+        scored = score_news_batch(classified, inplace=True)
     
     aggregates = calculate_aggregate_scores(scored)
     alerts = detector.detect_alerts(aggregates)
@@ -97,8 +98,8 @@ def generate_dashboard_data():
     zero_count = aggregates.get("zero_score_count", 0)
     zero_ratio = (zero_count / news_count * 100) if news_count > 0 else 0
     
-    plus2_count = sum(1 for n in scored if n.get("impact_score", 0) >= 2)
-    minus2_count = sum(1 for n in scored if n.get("impact_score", 0) <= -2)
+    plus2_count = aggregates.get("plus2_count", 0)
+    minus2_count = aggregates.get("minus2_count", 0)
     plus2_ratio = (plus2_count / news_count * 100) if news_count > 0 else 0
     minus2_ratio = (minus2_count / news_count * 100) if news_count > 0 else 0
     
@@ -321,8 +322,10 @@ def _group_political_events(events):
         event_dict = event.to_dict() if hasattr(event, 'to_dict') else event
         speaker = event_dict.get("speaker", "不明")
         
-        if speaker not in grouped:
-            grouped[speaker] = {
+        # 発言者ごとのグループは1回の参照で取得（初出時のみ生成）
+        group = grouped.get(speaker)
+        if group is None:
+            group = grouped[speaker] = {
                 "speaker": speaker,
                 "themes": {},
                 "items": [],  # summary + URL のペアリスト
@@ -330,10 +333,11 @@ def _group_political_events(events):
             }
         
         context = event_dict.get("context", "その他")
-        grouped[speaker]["themes"][context] = grouped[speaker]["themes"].get(context, 0) + 1
+        themes = group["themes"]
+        themes[context] = themes.get(context, 0) + 1
         
         # summary と url をペアで保存（詳細情報付き）
-        grouped[speaker]["items"].append({
+        group["items"].append({
             "summary": event_dict.get("summary", ""),
             "title": event_dict.get("title", ""),
             "description": event_dict.get("original_text", ""), # 冒頭テキスト
@@ -342,7 +346,7 @@ def _group_political_events(events):
             "score": event_dict.get("impact_score", 0),
             "reason": event_dict.get("score_reason", ""),
         })
-        grouped[speaker]["sources"].append(event_dict.get("source_name", ""))
+        group["sources"].append(event_dict.get("source_name", ""))
     
     # リスト形式に変換
     result = []
@@ -360,7 +364,7 @@ def _group_political_events(events):
             "themes": [{"name": k, "count": v} for k, v in data["themes"].items()],
             "articles": unique_items[:5],  # items -> articles
             "count": len(unique_items),    # count追加
-            "sources": list(set(data["sources"]))[:3],
+            "sources": first_unique(data["sources"], 3),
         })
     
     return result